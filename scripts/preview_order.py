@@ -43,7 +43,11 @@ def preview_bracket_order(client: IBKRClient, strategy: PutSellingStrategy):
         Tuple of (parent_trade, tp_trade, sl_trade) or None on failure.
     """
     # Create trade order
-    order = strategy.create_trade_order()
+    try:
+        order = strategy.create_trade_order()
+    except ValueError as e:
+        print(f"ERROR: Could not build order: {e}")
+        return None
     if order is None:
         print("ERROR: No suitable option found")
         return None
@@ -78,6 +78,10 @@ CREATE TABLE positions (
 CREATE INDEX idx_positions_status ON positions(status);
 CREATE INDEX idx_positions_expiration ON positions(expiration);
 CREATE INDEX idx_positions_strategy ON positions(strategy_id);
+-- Open book only (partial): serves get_open_positions' ORDER BY expiration, strike
+-- and get_position_by_contract's (symbol, strike, expiration) lookup
+CREATE INDEX idx_positions_open_contract ON positions(expiration, strike, symbol)
+    WHERE status = 'OPEN';
 
 -- book_snapshots: Daily snapshot of portfolio metrics
 -- Captured at end of each trading day for historical tracking.
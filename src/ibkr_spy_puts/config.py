@@ -1,5 +1,7 @@
 """Configuration management using Pydantic Settings."""
 
+from pathlib import Path
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -97,6 +99,16 @@ class ExitOrderSettings(BaseSettings):
     # 200% means buy back at 300% of original (e.g., sold for $1, buy back at $3, losing $2)
     stop_loss_pct: float = 200.0
 
+    @property
+    def take_profit_factor(self) -> float:
+        """Multiplier from sell price to take profit price (e.g., 60% -> 0.4)."""
+        return 1 - self.take_profit_pct / 100
+
+    @property
+    def stop_loss_factor(self) -> float:
+        """Multiplier from sell price to stop loss price (e.g., 200% -> 3.0)."""
+        return 1 + self.stop_loss_pct / 100
+
 
 class ScheduleSettings(BaseSettings):
     """Trading schedule settings."""
@@ -124,6 +136,22 @@ class Settings(BaseSettings):
     schedule: ScheduleSettings = ScheduleSettings()
 
 
+# Project-level .env, shared by the scheduler, one-shot and monitor entry points
+ENV_FILE = Path(__file__).parent.parent.parent / ".env"
+_env_loaded = False
+
+
+def load_env() -> None:
+    """Load ENV_FILE into os.environ once (existing variables take precedence)."""
+    global _env_loaded
+    if _env_loaded:
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv(ENV_FILE)
+    _env_loaded = True
+
+
 def get_settings() -> Settings:
     """Get application settings."""
     return Settings()
@@ -459,6 +459,7 @@ class IBConnectionManager:
         # Use delayed data for options
         self.ib.reqMarketDataType(3)
 
+        pending: dict[str, Option] = {}
         for pos in self._db_positions:
             exp = pos['expiration']
             if hasattr(exp, 'strftime'):
@@ -466,21 +467,34 @@ class IBConnectionManager:
             else:
                 exp_str = str(exp).replace('-', '')
 
-            key = self._get_position_key(pos['symbol'], float(pos['strike']), exp_str)
+            strike = float(pos['strike'])
+            key = self._get_position_key(pos['symbol'], strike, exp_str)
 
             # Skip if already subscribed
             if key in self._option_tickers:
                 continue
+            pending[key] = Option(pos['symbol'], exp_str, strike, 'P', 'SMART')
 
+        if not pending:
+            return
+
+        # Qualify every new contract in one request instead of one round trip each;
+        # qualifyContracts fills in conId in place for those it resolves
+        try:
+            self.ib.qualifyContracts(*pending.values())
+        except Exception as e:
+            logger.error(f"Failed to qualify {len(pending)} option contracts: {e}")
+            return
+
+        for key, contract in pending.items():
+            if not contract.conId:
+                continue
             try:
-                contract = Option(pos['symbol'], exp_str, float(pos['strike']), 'P', 'SMART')
-                qualified = self.ib.qualifyContracts(contract)
-                if qualified:
-                    # Request with Greeks (tick type 106)
-                    ticker = self.ib.reqMktData(qualified[0], "106", False, False)
-                    self._option_tickers[key] = ticker
-                    self._option_contracts[key] = qualified[0]
-                    logger.debug(f"Subscribed to {key}")
+                # Request with Greeks (tick type 106)
+                ticker = self.ib.reqMktData(contract, "106", False, False)
+                self._option_tickers[key] = ticker
+                self._option_contracts[key] = contract
+                logger.debug(f"Subscribed to {key}")
             except Exception as e:
                 logger.error(f"Failed to subscribe to {key}: {e}")
 
@@ -617,10 +631,10 @@ class IBConnectionManager:
                 exp_date = exp
             else:
                 exp_str = str(exp).replace('-', '')
-                from datetime import datetime as dt
-                exp_date = dt.strptime(exp_str, '%Y%m%d').date()
+                exp_date = datetime.strptime(exp_str, '%Y%m%d').date()
 
-            key = self._get_position_key(pos['symbol'], float(pos['strike']), exp_str)
+            strike = float(pos['strike'])
+            key = self._get_position_key(pos['symbol'], strike, exp_str)
 
             # Create position data from DB
             entry_time = pos.get('entry_time')
@@ -632,7 +646,7 @@ class IBConnectionManager:
             position_data = PositionData(
                 id=pos['id'],
                 symbol=pos['symbol'],
-                strike=float(pos['strike']),
+                strike=strike,
                 expiration=exp_str,
                 quantity=pos['quantity'],
                 entry_price=float(pos['entry_price']),
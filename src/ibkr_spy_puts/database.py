@@ -1,5 +1,7 @@
 """Database operations for trade logging and position tracking."""
 
+import itertools
+import threading
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import date, datetime
@@ -54,6 +56,13 @@ class Position:
     strategy_id: str = "spy-put-selling"
 
 
+# Columns read back into Position (skips created_at/updated_at bookkeeping)
+POSITION_COLUMNS = (
+    "id, symbol, strike, expiration, quantity, entry_price, entry_time, "
+    "exit_price, exit_time, expected_tp_price, expected_sl_price, status, strategy_id"
+)
+
+
 @dataclass
 class BookSnapshot:
     """Daily snapshot of portfolio metrics.
@@ -86,6 +95,12 @@ class Database:
         """
         self.settings = settings or DatabaseSettings()
         self._conn = None
+        self._in_transaction = False
+        # One instance can be shared by scheduler jobs on different threads:
+        # the lock is held for a whole transaction (or a single cursor block
+        # outside one), so no thread's writes land in another's transaction
+        self._lock = threading.RLock()
+        self._savepoint_ids = itertools.count(1)
 
     def connect(self) -> bool:
         """Establish database connection.
@@ -94,48 +109,141 @@ class Database:
         - paper mode -> ibkr_puts_paper
         - live mode -> ibkr_puts
 
+        Any previous connection (e.g. a broken one being replaced) is
+        closed first.
+
         Returns:
             True if connected successfully.
         """
-        try:
-            self._conn = psycopg2.connect(
-                host=self.settings.host,
-                port=self.settings.port,
-                dbname=self.settings.effective_name,
-                user=self.settings.user,
-                password=self.settings.password,
-            )
-            return True
-        except psycopg2.Error as e:
-            print(f"Database connection error: {e}")
-            return False
+        with self._lock:
+            self.disconnect()
+            try:
+                self._conn = psycopg2.connect(
+                    host=self.settings.host,
+                    port=self.settings.port,
+                    dbname=self.settings.effective_name,
+                    user=self.settings.user,
+                    password=self.settings.password,
+                )
+                return True
+            except psycopg2.Error as e:
+                print(f"Database connection error: {e}")
+                return False
 
     def disconnect(self):
         """Close database connection."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
 
     @property
     def is_connected(self) -> bool:
         """Check if database is connected."""
         return self._conn is not None and not self._conn.closed
 
+    def is_alive(self) -> bool:
+        """Check that the connection is usable with a lightweight round-trip.
+
+        Returns:
+            True if the server answered ``SELECT 1``.
+        """
+        if not self.is_connected:
+            return False
+        try:
+            with self.cursor() as cur:
+                cur.execute("SELECT 1")
+            return True
+        except psycopg2.Error:
+            return False
+
     @contextmanager
     def cursor(self):
-        """Get a database cursor with automatic commit/rollback."""
+        """Get a database cursor with automatic commit/rollback.
+
+        Inside transaction() the block just joins the transaction: nothing
+        is committed until it ends, and an error rolls all of it back
+        (see savepoint() to isolate a block).
+        """
         if not self.is_connected:
             raise RuntimeError("Database not connected")
 
-        cur = self._conn.cursor(cursor_factory=RealDictCursor)
-        try:
-            yield cur
-            self._conn.commit()
-        except Exception:
-            self._conn.rollback()
-            raise
-        finally:
-            cur.close()
+        with self._lock:
+            cur = self._conn.cursor(cursor_factory=RealDictCursor)
+            try:
+                if self._in_transaction:
+                    yield cur
+                else:
+                    try:
+                        yield cur
+                        self._conn.commit()
+                    except Exception:
+                        self._conn.rollback()
+                        raise
+            finally:
+                cur.close()
+
+    @contextmanager
+    def savepoint(self):
+        """Isolate a block inside transaction() behind a savepoint.
+
+        If the block raises, only its own writes are undone and the outer
+        transaction stays usable. Outside a transaction the block simply
+        runs in its own transaction. Each savepoint gets its own name, so
+        savepoints can nest.
+        """
+        with self._lock:
+            if not self._in_transaction:
+                with self.transaction():
+                    yield self
+                return
+
+            name = f"sp_{next(self._savepoint_ids)}"
+            with self._conn.cursor() as cur:
+                cur.execute(f"SAVEPOINT {name}")
+            try:
+                yield self
+            except Exception:
+                with self._conn.cursor() as cur:
+                    cur.execute(f"ROLLBACK TO SAVEPOINT {name}")
+                raise
+            with self._conn.cursor() as cur:
+                cur.execute(f"RELEASE SAVEPOINT {name}")
+
+    @contextmanager
+    def transaction(self, synchronous_commit: bool = True):
+        """Group several operations into a single commit.
+
+        Commits once when the block exits, or rolls everything back if the
+        block raises. Nested use on the same thread joins the outer
+        transaction; other threads wait for it to finish.
+
+        Args:
+            synchronous_commit: If False, the commit doesn't wait for the WAL
+                flush (SET LOCAL, this transaction only). Only for writes
+                that can be rebuilt from IBKR if the last moments are lost.
+        """
+        if not self.is_connected:
+            raise RuntimeError("Database not connected")
+
+        # Held until commit/rollback: other threads wait rather than join
+        with self._lock:
+            if self._in_transaction:
+                yield self
+                return
+
+            self._in_transaction = True
+            try:
+                if not synchronous_commit:
+                    with self._conn.cursor() as cur:
+                        cur.execute("SET LOCAL synchronous_commit = off")
+                yield self
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+            finally:
+                self._in_transaction = False
 
     # =========================================================================
     # Trade Log Operations (pure execution history)
@@ -283,7 +391,9 @@ class Database:
             Position or None if not found.
         """
         with self.cursor() as cur:
-            cur.execute("SELECT * FROM positions WHERE id = %s", (position_id,))
+            cur.execute(
+                f"SELECT {POSITION_COLUMNS} FROM positions WHERE id = %s", (position_id,)
+            )
             row = cur.fetchone()
             if row:
                 return self._row_to_position(row)
@@ -297,10 +407,25 @@ class Database:
         """
         with self.cursor() as cur:
             cur.execute(
-                "SELECT * FROM positions WHERE status = 'OPEN' ORDER BY expiration, strike"
+                f"SELECT {POSITION_COLUMNS} FROM positions "
+                "WHERE status = 'OPEN' ORDER BY expiration, strike"
             )
             return [self._row_to_position(row) for row in cur.fetchall()]
 
+    def get_open_positions_marker(self) -> tuple[int, int]:
+        """Get a cheap marker that changes when the open book changes.
+
+        Returns:
+            Tuple of (open position count, highest open position id).
+        """
+        with self.cursor() as cur:
+            cur.execute(
+                "SELECT COUNT(*) AS open_count, COALESCE(MAX(id), 0) AS max_id "
+                "FROM positions WHERE status = 'OPEN'"
+            )
+            row = cur.fetchone()
+            return row["open_count"], row["max_id"]
+
     def get_positions_for_display(self) -> list[dict[str, Any]]:
         """Get open positions with calculated fields for dashboard display.
 
@@ -378,9 +503,10 @@ class Database:
         """
         with self.cursor() as cur:
             cur.execute(
-                """
-                SELECT * FROM positions
+                f"""
+                SELECT {POSITION_COLUMNS} FROM positions
                 WHERE symbol = %s AND strike = %s AND expiration = %s AND status = 'OPEN'
+                LIMIT 1
                 """,
                 (symbol, strike, expiration),
             )
@@ -419,12 +545,16 @@ class Database:
     def insert_snapshot(self, snapshot: BookSnapshot) -> int:
         """Insert a daily book snapshot.
 
+        A second snapshot on the same date replaces the first, unless every
+        metric is unchanged, in which case nothing is written.
+
         Args:
             snapshot: BookSnapshot to insert.
 
         Returns:
             The new snapshot ID.
         """
+        snapshot_date = snapshot.snapshot_date or date.today()
         with self.cursor() as cur:
             cur.execute(
                 """
@@ -450,10 +580,24 @@ class Database:
                     unrealized_pnl = EXCLUDED.unrealized_pnl,
                     maintenance_margin = EXCLUDED.maintenance_margin,
                     spy_price = EXCLUDED.spy_price
+                -- Re-snapshots of an unchanged book leave the row alone
+                WHERE (
+                    book_snapshots.open_positions, book_snapshots.total_contracts,
+                    book_snapshots.total_delta, book_snapshots.total_theta,
+                    book_snapshots.total_gamma, book_snapshots.total_vega,
+                    book_snapshots.unrealized_pnl, book_snapshots.maintenance_margin,
+                    book_snapshots.spy_price
+                ) IS DISTINCT FROM (
+                    EXCLUDED.open_positions, EXCLUDED.total_contracts,
+                    EXCLUDED.total_delta, EXCLUDED.total_theta,
+                    EXCLUDED.total_gamma, EXCLUDED.total_vega,
+                    EXCLUDED.unrealized_pnl, EXCLUDED.maintenance_margin,
+                    EXCLUDED.spy_price
+                )
                 RETURNING id
                 """,
                 {
-                    "snapshot_date": snapshot.snapshot_date or date.today(),
+                    "snapshot_date": snapshot_date,
                     "snapshot_time": snapshot.snapshot_time or datetime.now(),
                     "open_positions": snapshot.open_positions,
                     "total_contracts": snapshot.total_contracts,
@@ -467,6 +611,13 @@ class Database:
                 },
             )
             result = cur.fetchone()
+            if result is None:
+                # Skipped as unchanged: return the existing row's ID
+                cur.execute(
+                    "SELECT id FROM book_snapshots WHERE snapshot_date = %s",
+                    (snapshot_date,),
+                )
+                result = cur.fetchone()
             return result["id"]
 
     def get_snapshots(self, limit: int = 30) -> list[dict[str, Any]]:
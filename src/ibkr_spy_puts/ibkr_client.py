@@ -1,13 +1,64 @@
 """IBKR TWS API client wrapper using ib_insync."""
 
+import functools
+import time
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 
-from ib_insync import IB, Contract, LimitOrder, Option, Order, Stock, TagValue, Trade
+from ib_insync import IB, Contract, LimitOrder, Option, Order, Stock, TagValue, Ticker, Trade
 
 from ibkr_spy_puts.config import TWSSettings
 
 
+# Cache lifetimes, matched to how often each kind of market data changes.
+# IBKRClient only caches listed expirations: quotes and greeks price live
+# orders (and each retry reprices), so they are always fetched fresh there.
+SPY_PRICE_TTL = 15  # seconds
+OPTION_CHAIN_TTL = 15 * 60  # same-day chain quotes/greeks
+EXPIRATIONS_TTL = 24 * 60 * 60  # listed expirations change at most daily
+
+
+def ttl_cache(seconds: float):
+    """Cache a client method's results per instance for a fixed time.
+
+    Entries are keyed on the call arguments and expire ``seconds`` after they
+    were stored (measured with ``time.monotonic``). Empty results (None, [])
+    are not cached, so a call made while disconnected is retried next time.
+    Pass ``use_cache=False`` to the decorated method to bypass the cache.
+
+    Args:
+        seconds: Time-to-live for cached results.
+
+    Returns:
+        Method decorator.
+    """
+
+    def decorator(method):
+        cache_attr = f"_ttl_cache_{method.__name__}"
+
+        @functools.wraps(method)
+        def wrapper(self, *args, use_cache: bool = True, **kwargs):
+            if not use_cache:
+                return method(self, *args, **kwargs)
+
+            cache = self.__dict__.setdefault(cache_attr, {})
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            entry = cache.get(key)
+            if entry is not None and now < entry[0]:
+                return entry[1]
+
+            result = method(self, *args, **kwargs)
+            if result:
+                cache[key] = (now + seconds, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
 @dataclass
 class OptionContract:
     """Represents a selected option contract with its details."""
@@ -21,6 +72,11 @@ class OptionContract:
     ask: float | None
     mid: float | None
     contract: Option
+    reference_price: float = field(init=False)  # mid, else bid, else 0
+
+    def __post_init__(self):
+        """Resolve the price estimate once, when the contract is discovered."""
+        self.reference_price = self.mid or self.bid or 0.0
 
 
 @dataclass
@@ -57,6 +113,24 @@ class IBKRClient:
         self.settings = settings or TWSSettings()
         self.ib = IB()
 
+        # Revision counters, bumped whenever TWS pushes an update, so callers
+        # can tell whether ib.trades()/positions()/fills() changed since they last looked
+        self.trades_rev = 0
+        self.positions_rev = 0
+        self.fills_rev = 0
+        self.ib.orderStatusEvent += self._bump_trades_rev
+        self.ib.positionEvent += self._bump_positions_rev
+        self.ib.execDetailsEvent += self._bump_fills_rev
+
+    def _bump_trades_rev(self, *_) -> None:
+        self.trades_rev += 1
+
+    def _bump_positions_rev(self, *_) -> None:
+        self.positions_rev += 1
+
+    def _bump_fills_rev(self, *_) -> None:
+        self.fills_rev += 1
+
     @property
     def is_connected(self) -> bool:
         """Check if connected to TWS."""
@@ -129,6 +203,7 @@ class IBKRClient:
         account_values = self.ib.accountSummary()
         return {av.tag: av.value for av in account_values}
 
+    @ttl_cache(EXPIRATIONS_TTL)
     def get_option_expirations(self, symbol: str = "SPY") -> list[date]:
         """Get available option expiration dates for a symbol.
 
@@ -234,6 +309,29 @@ class IBKRClient:
         else:
             self.ib.reqMarketDataType(1)
 
+        tickers = self._request_option_chain(symbol, expiration, right)
+        if not tickers:
+            return []
+
+        self._wait_for_greeks(tickers)
+        return self._collect_option_chain(symbol, right, tickers)
+
+    def _request_option_chain(
+        self,
+        symbol: str,
+        expiration: date,
+        right: str,
+    ) -> list[tuple[Option, Ticker]]:
+        """Subscribe to quotes and greeks for one expiration's near-the-money strikes.
+
+        Args:
+            symbol: The underlying symbol.
+            expiration: Option expiration date.
+            right: 'P' for puts, 'C' for calls.
+
+        Returns:
+            (contract, ticker) pairs with live subscriptions; empty if none.
+        """
         stock = Stock(symbol, "SMART", "USD")
         self.ib.qualifyContracts(stock)
 
@@ -282,17 +380,18 @@ class IBKRClient:
             current_price = 600.0  # Fallback estimate
             logger.info(f"Using fallback price estimate: {current_price}")
 
-        # Filter strikes to reasonable range (within 20% of current price)
+        # Filter strikes to reasonable range (within 20% of current price).
+        # Sort once and slice the range by bisection instead of testing every strike.
+        sorted_strikes = sorted(strikes)
         if current_price and current_price > 0:
             min_strike = current_price * 0.80
             max_strike = current_price * 1.05  # For puts, focus on OTM
-            strikes = {s for s in strikes if min_strike <= s <= max_strike}
+            lo = bisect_left(sorted_strikes, min_strike)
+            hi = bisect_right(sorted_strikes, max_strike)
+            sorted_strikes = sorted_strikes[lo:hi]
 
-        # Create option contracts
-        options = []
-        for strike in sorted(strikes):
-            opt = Option(symbol, exp_str, strike, right, "SMART")
-            options.append(opt)
+        # Create option contracts (strikes are already in ascending order)
+        options = [Option(symbol, exp_str, strike, right, "SMART") for strike in sorted_strikes]
 
         if not options:
             return []
@@ -301,15 +400,23 @@ class IBKRClient:
         qualified = self.ib.qualifyContracts(*options)
 
         # Request market data and greeks for all options
-        import logging
-        logger = logging.getLogger(__name__)
-
         tickers = []
         for opt in qualified:
             # Request with greeks (generic tick 106 = option greeks)
             ticker = self.ib.reqMktData(opt, "106", False, False)
             tickers.append((opt, ticker))
 
+        return tickers
+
+    def _wait_for_greeks(self, tickers: list[tuple[Option, Ticker]]) -> None:
+        """Wait until enough subscribed options report a delta.
+
+        Args:
+            tickers: (contract, ticker) pairs from _request_option_chain.
+        """
+        import logging
+        logger = logging.getLogger(__name__)
+
         # Wait for data with retry logic for delta availability
         # At market open, delta may not be available for all options immediately
         initial_wait = 5  # Increased from 3s to 5s
@@ -339,7 +446,22 @@ class IBKRClient:
             pct = with_delta / len(tickers) if tickers else 0
             logger.warning(f"After {max_retries} retries, only {with_delta}/{len(tickers)} ({pct:.1%}) have delta")
 
-        # Collect results
+    def _collect_option_chain(
+        self,
+        symbol: str,
+        right: str,
+        tickers: list[tuple[Option, Ticker]],
+    ) -> list[OptionContract]:
+        """Read quotes and greeks off the tickers and cancel their subscriptions.
+
+        Args:
+            symbol: The underlying symbol.
+            right: 'P' for puts, 'C' for calls.
+            tickers: (contract, ticker) pairs from _request_option_chain.
+
+        Returns:
+            List of OptionContract with greeks and prices.
+        """
         results = []
         for opt, ticker in tickers:
             delta = None
@@ -412,6 +534,80 @@ class IBKRClient:
             logger.warning(f"No option chain found for {symbol} {expiration}")
             return None
 
+        return self._select_by_delta(chain, target_delta)
+
+    def find_puts_by_delta_batch(
+        self,
+        specs: list[tuple[float, int, str]],
+        use_delayed: bool = True,
+    ) -> list[OptionContract | None]:
+        """Find the put closest to target delta and DTE for several targets at once.
+
+        Every distinct (symbol, expiration) chain is subscribed up front and
+        all of them share one wait for greeks, instead of paying the data wait
+        once per target as repeated find_put_by_delta calls would.
+
+        Args:
+            specs: (target_delta, target_dte, symbol) per requested put.
+            use_delayed: Use delayed market data.
+
+        Returns:
+            One OptionContract (or None if unavailable) per spec, in order.
+        """
+        import logging
+        logger = logging.getLogger(__name__)
+
+        if not self.is_connected:
+            return [None] * len(specs)
+
+        # Resolve each target's expiration; targets landing on the same
+        # expiration share its chain
+        expirations = [self.find_expiration_by_dte(dte, symbol) for _, dte, symbol in specs]
+        chain_keys = {
+            (symbol, expiration)
+            for (_, _, symbol), expiration in zip(specs, expirations)
+            if expiration
+        }
+
+        self.ib.reqMarketDataType(3 if use_delayed else 1)
+        pending = {key: self._request_option_chain(*key, "P") for key in chain_keys}
+
+        all_tickers = [pair for tickers in pending.values() for pair in tickers]
+        if all_tickers:
+            self._wait_for_greeks(all_tickers)
+        chains = {
+            key: self._collect_option_chain(key[0], "P", tickers)
+            for key, tickers in pending.items()
+        }
+
+        results: list[OptionContract | None] = []
+        for (target_delta, target_dte, symbol), expiration in zip(specs, expirations):
+            chain = chains.get((symbol, expiration)) if expiration else None
+            if not chain:
+                logger.warning(f"No option chain found for {symbol} {target_dte} DTE")
+                results.append(None)
+                continue
+            results.append(self._select_by_delta(chain, target_delta))
+        return results
+
+    def _select_by_delta(
+        self,
+        chain: list[OptionContract],
+        target_delta: float,
+    ) -> OptionContract | None:
+        """Pick the put closest to target delta from one expiration's chain.
+
+        Args:
+            chain: Options for a single expiration, with greeks.
+            target_delta: Target delta (negative for puts, e.g., -0.15).
+
+        Returns:
+            OptionContract closest to target delta, or None if no consecutive
+            strikes bracket the target.
+        """
+        import logging
+        logger = logging.getLogger(__name__)
+
         # Filter to options with valid delta
         options_with_delta = [opt for opt in chain if opt.delta is not None]
         logger.info(f"Found {len(chain)} options, {len(options_with_delta)} with valid delta")
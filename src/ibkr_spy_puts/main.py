@@ -19,10 +19,16 @@ Usage:
 """
 
 import argparse
+import signal
+import sys
 
 
-def main():
-    """Main entry point."""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser.
+
+    Returns:
+        Fully configured argument parser.
+    """
     parser = argparse.ArgumentParser(
         description="IBKR SPY Put Selling Bot",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -73,11 +79,18 @@ Examples:
         help="Force run on non-trading days (weekends/holidays)",
     )
 
-    args = parser.parse_args()
+    return parser
 
-    from ibkr_spy_puts.scheduler import run_scheduler, create_trade_function
 
+def main():
+    """Main entry point."""
+    args = build_parser().parse_args()
+
+    # Imports are deferred until after argument parsing so --help stays fast,
+    # and each mode only imports what it uses.
     if args.scheduler:
+        from ibkr_spy_puts.scheduler import run_scheduler
+
         # Scheduler mode: run continuously, execute at scheduled times
         run_scheduler(
             use_mock=args.mock,
@@ -97,6 +110,16 @@ Examples:
         print("=" * 60)
         print()
 
+        # Turn SIGTERM into a normal exit so the trade's finally block and
+        # atexit hooks disconnect from TWS instead of leaving the session open
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+        from ibkr_spy_puts.config import load_env
+        from ibkr_spy_puts.scheduler import configure_logging, create_trade_function
+
+        configure_logging()
+        load_env()
+
         trade_func = create_trade_function(
             use_mock=args.mock,
             dry_run=args.dry_run,
@@ -7,22 +7,117 @@ instead of connecting to TWS. This enables:
 - Reproducible tests with consistent data
 """
 
+import functools
+import itertools
 import json
+import warnings
+from bisect import bisect_left
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
-from ibkr_spy_puts.ibkr_client import TradeResult, OptionContract
+from ibkr_spy_puts.ibkr_client import (
+    EXPIRATIONS_TTL,
+    OPTION_CHAIN_TTL,
+    SPY_PRICE_TTL,
+    OptionContract,
+    TradeResult,
+    ttl_cache,
+)
 
 
 # Default fixtures directory
 DEFAULT_FIXTURES_DIR = Path(__file__).parent.parent.parent / "tests" / "fixtures"
 
+# Mock order ID sequence (unique per process, never collides across trades)
+_MOCK_ORDER_IDS = itertools.count(10000)
 
-@dataclass
+
+def _read_json(path: Path) -> Any:
+    """Read and decode a JSON fixture file."""
+    return json.loads(path.read_bytes())
+
+
+@functools.lru_cache(maxsize=8)
+def _load_fixtures_cached(fixtures_dir: Path) -> Mapping[str, Any]:
+    """Load all available fixtures from a directory, once per process.
+
+    The mock only ever reads fixture data, so every MockIBKRClient for the
+    same directory shares one read-only mapping instead of re-reading and
+    re-parsing the files.
+
+    Args:
+        fixtures_dir: Resolved fixtures directory (the cache key).
+
+    Returns:
+        Read-only mapping of fixture data.
+    """
+    # Load complete market data if available
+    market_data_path = fixtures_dir / "market_data.json"
+    if market_data_path.exists():
+        return MappingProxyType(_read_json(market_data_path))
+
+    # Individual fixtures are legacy: capture_market_data.py always
+    # writes market_data.json, which loads in a single read
+    warnings.warn(
+        f"No market_data.json in {fixtures_dir}; loading individual "
+        "fixture files is deprecated. Re-run scripts/capture_market_data.py "
+        "to generate market_data.json.",
+        DeprecationWarning,
+        stacklevel=4,
+    )
+    return MappingProxyType(_load_individual_fixtures(fixtures_dir))
+
+
+def _load_individual_fixtures(fixtures_dir: Path) -> dict[str, Any]:
+    """Load individual fixture files (deprecated, see _load_fixtures_cached)."""
+    data: dict[str, Any] = {}
+
+    # SPY price
+    spy_price_path = fixtures_dir / "spy_price.json"
+    if spy_price_path.exists():
+        data["spy_price"] = _read_json(spy_price_path).get("price")
+
+    # Expirations
+    exp_path = fixtures_dir / "spy_expirations.json"
+    if exp_path.exists():
+        data["expirations"] = _read_json(exp_path).get("expirations", [])
+
+    # Option chain (JSON-lines preferred, JSON kept as fallback)
+    jsonl_path = fixtures_dir / "spy_option_chain.jsonl"
+    chain_rows = _load_jsonl_chain(jsonl_path) if jsonl_path.exists() else None
+    chain_path = fixtures_dir / "spy_option_chain.json"
+    if chain_rows is not None:
+        data["option_chain"] = chain_rows
+    elif chain_path.exists():
+        chain_data = _read_json(chain_path)
+        data["option_chain"] = chain_data.get("chain", [])
+        data["target_expiration"] = chain_data.get("expiration")
+        data["target_dte"] = chain_data.get("target_dte")
+        # Don't let a null chain-level price clobber spy_price.json
+        if chain_data.get("spy_price") is not None:
+            data["spy_price"] = chain_data["spy_price"]
+
+    return data
+
+
+def _load_jsonl_chain(chain_path: Path) -> list[dict[str, Any]]:
+    """Load option chain rows from a JSON-lines fixture, one row per line.
+
+    Args:
+        chain_path: Path to a ``.jsonl`` option chain.
+
+    Returns:
+        List of row dicts.
+    """
+    return [json.loads(line) for line in chain_path.read_text().splitlines() if line]
+
+
+@dataclass(slots=True)
 class MockOption:
-    """Mock ib_insync Option contract for testing."""
+    """Mock ib_insync Option contract for testing (slotted: one per chain row)."""
 
     symbol: str
     lastTradeDateOrContractMonth: str
@@ -48,45 +143,77 @@ class MockIBKRClient:
         """
         self.fixtures_dir = Path(fixtures_dir) if fixtures_dir else DEFAULT_FIXTURES_DIR
         self._connected = False
-        self._data: dict[str, Any] = {}
+        self._data: Mapping[str, Any] = {}
         self._load_fixtures()
+        self._index_fixtures()
 
     def _load_fixtures(self) -> None:
-        """Load all available fixtures."""
-        # Load complete market data if available
-        market_data_path = self.fixtures_dir / "market_data.json"
-        if market_data_path.exists():
-            with open(market_data_path) as f:
-                self._data = json.load(f)
-        else:
-            # Load individual fixtures
-            self._load_individual_fixtures()
-
-    def _load_individual_fixtures(self) -> None:
-        """Load individual fixture files."""
-        # SPY price
-        spy_price_path = self.fixtures_dir / "spy_price.json"
-        if spy_price_path.exists():
-            with open(spy_price_path) as f:
-                data = json.load(f)
-                self._data["spy_price"] = data.get("price")
-
-        # Expirations
-        exp_path = self.fixtures_dir / "spy_expirations.json"
-        if exp_path.exists():
-            with open(exp_path) as f:
-                data = json.load(f)
-                self._data["expirations"] = data.get("expirations", [])
-
-        # Option chain
-        chain_path = self.fixtures_dir / "spy_option_chain.json"
-        if chain_path.exists():
-            with open(chain_path) as f:
-                data = json.load(f)
-                self._data["option_chain"] = data.get("chain", [])
-                self._data["target_expiration"] = data.get("expiration")
-                self._data["target_dte"] = data.get("target_dte")
-                self._data["spy_price"] = data.get("spy_price")
+        """Load all available fixtures (shared across instances per directory)."""
+        self._data = _load_fixtures_cached(self.fixtures_dir.resolve())
+
+    def _index_fixtures(self) -> None:
+        """Pre-build derived lookups from the loaded fixtures.
+
+        The fixtures are immutable, so expirations are parsed and sorted
+        once, and each chain row's expiration is parsed once, instead of on
+        every call. Fixtures capture a single expiration that is served for
+        whichever expiration is requested, so chains are built per
+        (right, expiration) on first request (see get_option_chain_with_greeks).
+        The puts with a valid delta are kept alongside a parallel list of
+        their deltas.
+        """
+        self._expirations: list[date] = sorted(
+            date.fromisoformat(exp) for exp in self._data.get("expirations", [])
+        )
+
+        # Parse and format each distinct expiration once, not once per row
+        exp_forms: dict[str, tuple[date, str]] = {}
+        # Fixture rows by right, with their parsed expiration
+        self._rows_by_right: dict[str, list[tuple[dict[str, Any], date]]] = {}
+        self._put_contracts: list[OptionContract] = []
+        for opt_data in self._data.get("option_chain", []):
+            iso = opt_data["expiration"]
+            if iso not in exp_forms:
+                exp_date = date.fromisoformat(iso)
+                exp_forms[iso] = (exp_date, exp_date.strftime("%Y%m%d"))
+            exp_date, exp_str = exp_forms[iso]
+            right = opt_data.get("right")
+            self._rows_by_right.setdefault(right, []).append((opt_data, exp_date))
+            if right == "P" and opt_data.get("delta") is not None:
+                self._put_contracts.append(self._build_contract(opt_data, exp_date, exp_str))
+        self._put_deltas: list[float] = [opt.delta for opt in self._put_contracts]
+
+        # Chains keyed by (right, expiration), built on first request
+        self._chains: dict[tuple[str, date], list[OptionContract]] = {}
+
+    @staticmethod
+    def _build_contract(
+        opt_data: dict[str, Any], expiration: date, exp_str: str
+    ) -> OptionContract:
+        """Build an OptionContract (with mock ib_insync contract) from a fixture row.
+
+        Args:
+            opt_data: Fixture chain row.
+            expiration: The row's parsed expiration date.
+            exp_str: Expiration for the mock contract, formatted as YYYYMMDD.
+        """
+        mock_contract = MockOption(
+            symbol=opt_data["symbol"],
+            lastTradeDateOrContractMonth=exp_str,
+            strike=opt_data["strike"],
+            right=opt_data["right"],
+        )
+        return OptionContract(
+            symbol=opt_data["symbol"],
+            strike=opt_data["strike"],
+            expiration=expiration,
+            right=opt_data["right"],
+            delta=opt_data.get("delta"),
+            bid=opt_data.get("bid"),
+            ask=opt_data.get("ask"),
+            mid=opt_data.get("mid"),
+            contract=mock_contract,  # type: ignore
+        )
 
     @property
     def is_connected(self) -> bool:
@@ -102,6 +229,7 @@ class MockIBKRClient:
         """Simulate disconnection."""
         self._connected = False
 
+    @ttl_cache(SPY_PRICE_TTL)
     def get_spy_price(self, use_delayed: bool = True) -> float | None:
         """Get SPY price from fixtures.
 
@@ -125,6 +253,7 @@ class MockIBKRClient:
             "AvailableFunds": "100000.00",
         })
 
+    @ttl_cache(EXPIRATIONS_TTL)
     def get_option_expirations(self, symbol: str = "SPY") -> list[date]:
         """Get option expirations from fixtures.
 
@@ -132,10 +261,9 @@ class MockIBKRClient:
             symbol: Symbol (only SPY supported in mock).
 
         Returns:
-            List of expiration dates.
+            List of expiration dates, sorted ascending (shared, do not mutate).
         """
-        exp_strings = self._data.get("expirations", [])
-        return [date.fromisoformat(exp) for exp in exp_strings]
+        return self._expirations
 
     def find_expiration_by_dte(
         self, target_dte: int, symbol: str = "SPY"
@@ -156,9 +284,17 @@ class MockIBKRClient:
         today = date.today()
         target_date = today + timedelta(days=target_dte)
 
-        closest = min(expirations, key=lambda x: abs((x - target_date).days))
-        return closest
-
+        # Expirations are sorted: the closest is one of the two neighbours
+        # of the insertion point (the earlier one wins ties)
+        i = bisect_left(expirations, target_date)
+        if i == 0:
+            return expirations[0]
+        if i == len(expirations):
+            return expirations[-1]
+        before, after = expirations[i - 1], expirations[i]
+        return before if target_date - before <= after - target_date else after
+
+    @ttl_cache(OPTION_CHAIN_TTL)
     def get_option_chain_with_greeks(
         self,
         symbol: str,
@@ -175,39 +311,18 @@ class MockIBKRClient:
             use_delayed: Ignored in mock.
 
         Returns:
-            List of OptionContract from fixtures.
+            List of OptionContract from fixtures (shared, do not mutate).
+            Their contracts carry the requested expiration.
         """
-        chain_data = self._data.get("option_chain", [])
-
-        results = []
-        for opt_data in chain_data:
-            # Filter by right if needed
-            if opt_data.get("right") != right:
-                continue
-
+        key = (right, expiration)
+        chain = self._chains.get(key)
+        if chain is None:
             exp_str = expiration.strftime("%Y%m%d")
-            mock_contract = MockOption(
-                symbol=opt_data["symbol"],
-                lastTradeDateOrContractMonth=exp_str,
-                strike=opt_data["strike"],
-                right=opt_data["right"],
-            )
-
-            results.append(
-                OptionContract(
-                    symbol=opt_data["symbol"],
-                    strike=opt_data["strike"],
-                    expiration=date.fromisoformat(opt_data["expiration"]),
-                    right=opt_data["right"],
-                    delta=opt_data.get("delta"),
-                    bid=opt_data.get("bid"),
-                    ask=opt_data.get("ask"),
-                    mid=opt_data.get("mid"),
-                    contract=mock_contract,  # type: ignore
-                )
-            )
-
-        return results
+            chain = self._chains[key] = [
+                self._build_contract(opt_data, row_exp, exp_str)
+                for opt_data, row_exp in self._rows_by_right.get(right, [])
+            ]
+        return chain
 
     def find_put_by_delta(
         self,
@@ -232,27 +347,36 @@ class MockIBKRClient:
         if not expiration:
             return None
 
-        # Get option chain
-        chain = self.get_option_chain_with_greeks(
-            symbol, expiration, right="P", use_delayed=use_delayed
-        )
-
-        if not chain:
+        # Search the precomputed delta column (puts with valid delta only)
+        deltas = self._put_deltas
+        if not deltas:
             return None
 
-        # Filter to options with valid delta
-        options_with_delta = [opt for opt in chain if opt.delta is not None]
+        # Find option closest to target delta. Comparing (diff, index) tuples
+        # avoids a Python-level key call per element; ties keep the lower index.
+        _, closest_idx = min(
+            [(abs(delta - target_delta), i) for i, delta in enumerate(deltas)]
+        )
+        return self._put_contracts[closest_idx]
 
-        if not options_with_delta:
-            return None
+    def find_puts_by_delta_batch(
+        self,
+        specs: list[tuple[float, int, str]],
+        use_delayed: bool = True,
+    ) -> list[OptionContract | None]:
+        """Find puts for several (target_delta, target_dte, symbol) specs.
 
-        # Find option closest to target delta
-        closest = min(
-            options_with_delta,
-            key=lambda x: abs(x.delta - target_delta) if x.delta else float("inf"),
-        )
+        Args:
+            specs: (target_delta, target_dte, symbol) per requested put.
+            use_delayed: Ignored in mock.
 
-        return closest
+        Returns:
+            One OptionContract (or None) per spec, in order.
+        """
+        return [
+            self.find_put_by_delta(target_delta, target_dte, symbol)
+            for target_delta, target_dte, symbol in specs
+        ]
 
     def execute_trade(
         self,
@@ -283,9 +407,8 @@ class MockIBKRClient:
                 error_message="Not connected",
             )
 
-        # Generate mock order IDs
-        import random
-        base_id = random.randint(10000, 99999)
+        # Generate mock order IDs (3 per trade: sell, take profit, stop loss)
+        base_id = next(_MOCK_ORDER_IDS) * 3
 
         return TradeResult(
             success=True,
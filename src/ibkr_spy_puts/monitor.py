@@ -14,16 +14,70 @@ Usage:
 
     # Run continuously (every 5 minutes during market hours)
     poetry run python -m ibkr_spy_puts.monitor --continuous
+
+    # Sync as soon as TWS reports a closed position (hourly catch-up)
+    poetry run python -m ibkr_spy_puts.monitor --events
 """
 
 import argparse
+import functools
+import logging
+import logging.handlers
+import queue
 import time
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 
-from ibkr_spy_puts.config import DatabaseSettings, TWSSettings
+import psycopg2
+
+from ibkr_spy_puts.config import DatabaseSettings, TWSSettings, load_env
 from ibkr_spy_puts.database import Database, Position, Trade
 from ibkr_spy_puts.ibkr_client import IBKRClient
+from ibkr_spy_puts.scheduler import MarketCalendar
+
+logger = logging.getLogger(__name__)
+
+
+ZERO = Decimal("0")
+
+
+def _to_decimal(value) -> Decimal | None:
+    """Convert an IBKR float to Decimal via str (avoids binary float artifacts)."""
+    return Decimal(str(value)) if value is not None else None
+
+
+@functools.lru_cache(maxsize=1024)
+def _fmt_yyyymmdd(d: date) -> str:
+    """Format an expiration like IBKR's lastTradeDateOrContractMonth (cached:
+    the book holds many positions but few distinct expirations)."""
+    return d.strftime("%Y%m%d")
+
+
+# Poll faster while an open position trades within this fraction of its TP/SL
+NEAR_TRIGGER_PCT = 0.05
+NEAR_TRIGGER_POLL_SECONDS = 15
+
+# Reconnect attempts per side, with exponential backoff starting at 1 second
+RECONNECT_ATTEMPTS = 3
+
+# Errors that mean a TWS or database connection dropped mid-cycle
+CONNECTION_ERRORS = (ConnectionError, psycopg2.OperationalError, psycopg2.InterfaceError)
+
+
+def _reconnect_on_error(method):
+    """Reconnect and retry a sync method once if a connection dropped."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except CONNECTION_ERRORS as e:
+            logger.warning(f"Connection lost during {method.__name__}: {e}; reconnecting")
+            if not self._ensure_connected():
+                raise
+            return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class PositionMonitor:
@@ -44,39 +98,77 @@ class PositionMonitor:
         self.db_settings = db_settings or DatabaseSettings()
         self.client: IBKRClient | None = None
         self.db: Database | None = None
+        self.calendar = MarketCalendar()
+        # (client, positions_rev, DB marker) of the last clean sync and its stats
+        self._synced_rev: tuple | None = None
+        self._synced_fingerprint: tuple | None = None
+        # Open positions by IBKR key as of the last full sync
+        self._open_positions: dict[tuple, list[Position]] = {}
+        self._last_stats: dict | None = None
+        # Set by _on_position when TWS reports a position going flat
+        self._positions_dirty = False
 
     def connect(self) -> bool:
-        """Connect to TWS and database.
+        """Connect to TWS and database, reusing any connection that is still live.
 
         Returns:
             True if both connections successful.
         """
-        # Connect to database
-        self.db = Database(settings=self.db_settings)
-        if not self.db.connect():
-            print("ERROR: Failed to connect to database")
-            return False
-        print("Connected to database")
+        return self._ensure_connected()
+
+    def _ensure_connected(self) -> bool:
+        """Reuse live connections, reconnecting only the side that dropped.
 
-        # Connect to TWS
-        self.client = IBKRClient(settings=self.tws_settings)
-        if not self.client.connect():
-            print("ERROR: Failed to connect to TWS")
+        Returns:
+            True if both TWS and the database are connected.
+        """
+        if self.db is None:
+            self.db = Database(settings=self.db_settings)
+        if not self.db.is_alive():
             self.db.disconnect()
-            return False
-        print("Connected to TWS")
+            if not self._retry(self.db.connect, "database"):
+                return False
+
+        if self.client is None:
+            self.client = IBKRClient(settings=self.tws_settings)
+        if not self.client.is_connected:
+            if not self._retry(self.client.connect, "TWS"):
+                return False
 
         return True
 
+    @staticmethod
+    def _retry(connect, name: str) -> bool:
+        """Call a connect function with exponential backoff.
+
+        Args:
+            connect: Function returning True once connected.
+            name: Name of the connection (for messages).
+
+        Returns:
+            True if a connection attempt succeeded.
+        """
+        for attempt in range(RECONNECT_ATTEMPTS):
+            if connect():
+                logger.info(f"Connected to {name}")
+                return True
+            if attempt < RECONNECT_ATTEMPTS - 1:
+                delay = 2 ** attempt
+                logger.warning(f"Failed to connect to {name}, retrying in {delay}s...")
+                time.sleep(delay)
+        logger.error(f"Failed to connect to {name}")
+        return False
+
     def disconnect(self):
         """Disconnect from TWS and database."""
         if self.client:
             self.client.disconnect()
-            print("Disconnected from TWS")
+            logger.info("Disconnected from TWS")
         if self.db:
             self.db.disconnect()
-            print("Disconnected from database")
+            logger.info("Disconnected from database")
 
+    @_reconnect_on_error
     def sync_positions(self) -> dict:
         """Sync position status between IBKR and database.
 
@@ -89,81 +181,142 @@ class PositionMonitor:
         if not self.client or not self.db:
             raise RuntimeError("Not connected")
 
+        # Let ib_insync apply updates TWS pushed while we were asleep; they
+        # are already buffered, so one pass of the event loop is enough
+        self.client.ib.sleep(0)
+
+        # Nothing can have closed if neither IBKR nor the database's open
+        # book changed since the last clean sync; the marker catches rows
+        # written by the trader (or by hand) that IBKR events wouldn't
+        db_marker = self.db.get_open_positions_marker()
+        rev = (self.client, self.client.positions_rev, db_marker)
+        if rev == self._synced_rev:
+            logger.info("IBKR positions unchanged since last sync, skipping")
+            return {**self._last_stats, "positions_closed": 0}
+
+        # Get positions from IBKR (ib_insync's in-memory copy, no round-trip)
+        ibkr_positions = self.client.ib.positions()
+        ibkr_option_positions = [
+            p for p in ibkr_positions if p.contract.secType == "OPT"
+        ]
+
+        # Events can fire without a real change (e.g. the full position
+        # replay after a reconnect); skip if the held contracts are the same
+        fingerprint = (
+            db_marker,
+            frozenset((p.contract.conId, p.position) for p in ibkr_option_positions),
+        )
+        if self._last_stats is not None and fingerprint == self._synced_fingerprint:
+            logger.info("IBKR option positions unchanged since last sync, skipping")
+            self._synced_rev = rev
+            return {**self._last_stats, "positions_closed": 0}
+
         stats = {
             "db_positions": 0,
-            "ibkr_positions": 0,
+            "ibkr_positions": len(ibkr_option_positions),
             "positions_closed": 0,
             "errors": 0,
         }
+        logger.info(f"Found {len(ibkr_option_positions)} option positions in IBKR")
 
         # Get open positions from database
         db_positions = self.db.get_open_positions()
         stats["db_positions"] = len(db_positions)
-        print(f"Found {len(db_positions)} open positions in database")
+        logger.info(f"Found {len(db_positions)} open positions in database")
 
-        # Get positions from IBKR
-        ibkr_positions = self.client.ib.positions()
-        ibkr_option_positions = [
-            p for p in ibkr_positions if p.contract.secType == "OPT"
-        ]
-        stats["ibkr_positions"] = len(ibkr_option_positions)
-        print(f"Found {len(ibkr_option_positions)} option positions in IBKR")
-
-        # Build lookup of IBKR positions by (symbol, strike, expiration)
-        ibkr_lookup = {}
-        for pos in ibkr_option_positions:
-            c = pos.contract
-            # Key: symbol_strike_expiration
-            key = (c.symbol, int(c.strike), c.lastTradeDateOrContractMonth)
-            ibkr_lookup[key] = pos
+        # Keys of IBKR positions: (symbol, int strike, YYYYMMDD expiration)
+        ibkr_keys = {
+            (p.contract.symbol, int(p.contract.strike), p.contract.lastTradeDateOrContractMonth)
+            for p in ibkr_option_positions
+        }
 
-        # Check each database position
+        # Group database positions by the same key
+        db_by_key: dict[tuple, list[Position]] = {}
         for db_pos in db_positions:
-            # Build key for lookup
-            exp_str = db_pos.expiration.strftime("%Y%m%d")
-            key = (db_pos.symbol, int(db_pos.strike), exp_str)
-
-            if key not in ibkr_lookup:
-                # Position is no longer in IBKR - it was closed
-                try:
-                    self._handle_closed_position(db_pos)
-                    stats["positions_closed"] += 1
-                except Exception as e:
-                    print(f"ERROR closing position {db_pos.id}: {e}")
-                    stats["errors"] += 1
+            key = (db_pos.symbol, int(db_pos.strike), _fmt_yyyymmdd(db_pos.expiration))
+            db_by_key.setdefault(key, []).append(db_pos)
+
+        # Positions no longer in IBKR were closed: one set difference
+        closed_keys = db_by_key.keys() - ibkr_keys
+        # Still-open book, for the polling interval's trigger proximity check
+        self._open_positions = {
+            key: positions for key, positions in db_by_key.items() if key not in closed_keys
+        }
+        if closed_keys:
+            fill_index = self._build_fill_index(self.client.ib.fills())
+            # One timestamp for every close in this cycle
+            now = datetime.now()
+
+            # Close them; all closes commit together. A crash can only lose
+            # closes that the next cycle re-detects, so skip the fsync wait.
+            # Each position gets a savepoint so one failure doesn't abort the rest
+            with self.db.transaction(synchronous_commit=False):
+                for key in closed_keys:
+                    for db_pos in db_by_key[key]:
+                        try:
+                            with self.db.savepoint():
+                                self._handle_closed_position(db_pos, fill_index.get(key), now)
+                            stats["positions_closed"] += 1
+                        except Exception as e:
+                            logger.error(f"Error closing position {db_pos.id}: {e}")
+                            stats["errors"] += 1
+
+        # Only skip future cycles once everything was handled; closes just
+        # changed the open book, so key on its new marker
+        if not stats["errors"]:
+            if stats["positions_closed"]:
+                db_marker = self.db.get_open_positions_marker()
+                rev = (*rev[:2], db_marker)
+                fingerprint = (db_marker, fingerprint[1])
+            self._synced_rev = rev
+            self._synced_fingerprint = fingerprint
+            self._last_stats = stats
 
         return stats
 
-    def _handle_closed_position(self, db_pos: Position):
+    @staticmethod
+    def _build_fill_index(fills: list) -> dict:
+        """Index option fills by contract, keeping the most recent per contract.
+
+        Args:
+            fills: Fills from ib.fills().
+
+        Returns:
+            Dict of (symbol, int strike, YYYYMMDD expiration) -> latest fill.
+        """
+        index = {}
+        for fill in fills:
+            c = fill.contract
+            if c.secType != "OPT":
+                continue
+            key = (c.symbol, int(c.strike), c.lastTradeDateOrContractMonth)
+            current = index.get(key)
+            if current is None or fill.execution.time > current.execution.time:
+                index[key] = fill
+        return index
+
+    def _handle_closed_position(
+        self, db_pos: Position, fill=None, now: datetime | None = None
+    ):
         """Handle a position that is no longer in IBKR.
 
         Args:
             db_pos: Database position that was closed.
+            fill: Latest IBKR fill for the position's contract, if any.
+            now: Cycle timestamp, used as the exit time when there is no fill.
         """
-        print(f"Position closed: {db_pos.symbol} {db_pos.strike}P {db_pos.expiration}")
+        logger.info(f"Position closed: {db_pos.symbol} {db_pos.strike}P {db_pos.expiration}")
 
         # We don't know the exact exit price without checking fills
         # For now, mark as closed with a placeholder
         # In production, you might want to fetch the fill details from IBKR executions
 
-        # Try to get the exit price from recent fills
+        # Take the exit price from the contract's most recent fill
         exit_price = None
-        exit_time = datetime.now()
-
-        # Check recent fills for this contract
-        for fill in self.client.ib.fills():
-            c = fill.contract
-            if (
-                c.secType == "OPT"
-                and c.symbol == db_pos.symbol
-                and int(c.strike) == int(db_pos.strike)
-            ):
-                exp_str = c.lastTradeDateOrContractMonth
-                if exp_str == db_pos.expiration.strftime("%Y%m%d"):
-                    # Found a fill for this contract
-                    exit_price = Decimal(str(fill.execution.avgPrice))
-                    exit_time = fill.execution.time
-                    break
+        exit_time = now or datetime.now()
+        if fill is not None:
+            exit_price = _to_decimal(fill.execution.avgPrice)
+            exit_time = fill.execution.time
 
         if exit_price:
             # Also log to trades table
@@ -178,60 +331,193 @@ class PositionMonitor:
                 fill_time=exit_time,
             )
             self.db.insert_trade(trade)
-            print(f"  Exit price: ${exit_price}")
+            logger.info(f"  Exit price: ${exit_price}")
 
             # Close the position
             self.db.close_position(db_pos.id, exit_price, exit_time)
         else:
             # No fill found - maybe expired worthless
             # Mark as closed without exit price
-            print("  Exit price unknown (possibly expired worthless)")
-            self.db.close_position(
-                db_pos.id, Decimal("0"), exit_time
-            )
+            logger.info("  Exit price unknown (possibly expired worthless)")
+            self.db.close_position(db_pos.id, ZERO, exit_time)
 
     def run_once(self):
         """Run a single sync cycle."""
-        print("=" * 60)
-        print(f"Position Monitor - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("=" * 60)
-
-        if not self.connect():
-            return
-
         try:
-            # Sync positions
-            stats = self.sync_positions()
-            print(f"\nSync complete:")
-            print(f"  DB positions: {stats['db_positions']}")
-            print(f"  IBKR positions: {stats['ibkr_positions']}")
-            print(f"  Positions closed: {stats['positions_closed']}")
-            print(f"  Errors: {stats['errors']}")
-
+            if self.connect():
+                self._run_cycle()
         finally:
             self.disconnect()
 
+    def _run_cycle(self):
+        """Sync positions over the current connections and report stats."""
+        logger.info("Position monitor sync")
+        stats = self.sync_positions()
+        # One record for the whole summary rather than a write per line
+        logger.info(
+            "Sync complete:\n"
+            f"  DB positions: {stats['db_positions']}\n"
+            f"  IBKR positions: {stats['ibkr_positions']}\n"
+            f"  Positions closed: {stats['positions_closed']}\n"
+            f"  Errors: {stats['errors']}"
+        )
+
+    def _near_trigger(self) -> bool:
+        """Check if any open position is trading close to its TP or SL price.
+
+        Uses the portfolio marks ib_insync keeps in memory (no TWS request).
+
+        Returns:
+            True if a position is within NEAR_TRIGGER_PCT of a bracket price.
+        """
+        if not self.client or not self._open_positions:
+            return False
+
+        for item in self.client.ib.portfolio():
+            c = item.contract
+            if c.secType != "OPT" or not item.marketPrice or item.marketPrice <= 0:
+                continue
+            key = (c.symbol, int(c.strike), c.lastTradeDateOrContractMonth)
+            price = item.marketPrice
+            for db_pos in self._open_positions.get(key, ()):
+                tp, sl = db_pos.expected_tp_price, db_pos.expected_sl_price
+                if tp and price <= float(tp) * (1 + NEAR_TRIGGER_PCT):
+                    return True
+                if sl and price >= float(sl) * (1 - NEAR_TRIGGER_PCT):
+                    return True
+        return False
+
+    def _next_wake_time(
+        self, now: datetime, interval_minutes: int, near_trigger: bool = False
+    ) -> datetime:
+        """Compute when the next sync cycle should run.
+
+        During market hours cycles run every interval_minutes, or every
+        NEAR_TRIGGER_POLL_SECONDS while a position is close to its TP/SL.
+        While the market is closed nothing can fill, so the monitor sleeps
+        straight through to the next open.
+
+        Args:
+            now: Current timezone-aware time.
+            interval_minutes: Minutes between sync cycles during market hours.
+            near_trigger: A position is close to its TP or SL price.
+
+        Returns:
+            Time of the next sync cycle.
+        """
+        interval = timedelta(minutes=interval_minutes)
+        if self.calendar.is_market_open(now):
+            if near_trigger:
+                return now + timedelta(seconds=NEAR_TRIGGER_POLL_SECONDS)
+            return now + interval
+
+        next_open = self.calendar.next_market_open(now)
+        return next_open if next_open is not None else now + interval
+
     def run_continuous(self, interval_minutes: int = 5):
         """Run continuous monitoring.
 
         Args:
-            interval_minutes: Minutes between sync cycles.
+            interval_minutes: Minutes between sync cycles during market hours.
+        """
+        logger.info(f"Starting continuous monitoring (every {interval_minutes} min during market hours)")
+
+        # Connections stay open across cycles; each cycle only reconnects
+        # whichever side has dropped
+        try:
+            while True:
+                try:
+                    if self._ensure_connected():
+                        self._run_cycle()
+                    next_wake = self._next_wake_time(
+                        datetime.now(timezone.utc), interval_minutes, self._near_trigger()
+                    )
+                    logger.info(f"Next sync at {next_wake.astimezone():%Y-%m-%d %H:%M:%S %Z}")
+                    delta = (next_wake - datetime.now(timezone.utc)).total_seconds()
+                    if delta > 0:
+                        time.sleep(delta)
+                except KeyboardInterrupt:
+                    logger.info("Stopping monitor...")
+                    break
+                except Exception as e:
+                    logger.error(f"Error in monitor loop: {e}; retrying in {interval_minutes} minutes")
+                    time.sleep(interval_minutes * 60)
+        finally:
+            self.disconnect()
+
+    def _on_position(self, position) -> None:
+        """positionEvent handler: flag a sync when an option position goes flat."""
+        if position.contract.secType == "OPT" and position.position == 0:
+            self._positions_dirty = True
+
+    def run_event_driven(self, reconcile_minutes: int = 60):
+        """Sync as soon as TWS reports a closed option position.
+
+        Instead of polling, the monitor waits on the ib_insync socket and
+        syncs when a positionEvent shows an option position going to zero.
+        A full reconcile still runs every reconcile_minutes as a catch-up
+        for anything missed (e.g. while disconnected).
+
+        Args:
+            reconcile_minutes: Minutes between catch-up syncs.
         """
-        print(f"Starting continuous monitoring (every {interval_minutes} min)")
-        print("Press Ctrl+C to stop")
-
-        while True:
-            try:
-                self.run_once()
-                print(f"\nNext sync in {interval_minutes} minutes...")
-                time.sleep(interval_minutes * 60)
-            except KeyboardInterrupt:
-                print("\nStopping monitor...")
-                break
-            except Exception as e:
-                print(f"ERROR in monitor loop: {e}")
-                print(f"Retrying in {interval_minutes} minutes...")
-                time.sleep(interval_minutes * 60)
+        logger.info(f"Starting event-driven monitoring (reconcile every {reconcile_minutes} min)")
+
+        reconcile_seconds = reconcile_minutes * 60
+        subscribed_client = None
+        next_reconcile = 0.0
+        try:
+            while True:
+                try:
+                    if not self._ensure_connected():
+                        # Keep retrying at the backoff's longest step rather
+                        # than leaving positions unwatched until the next
+                        # reconcile, and reconcile as soon as we're back
+                        time.sleep(2 ** (RECONNECT_ATTEMPTS - 1))
+                        next_reconcile = 0.0
+                        continue
+                    if self.client is not subscribed_client:
+                        self.client.ib.positionEvent += self._on_position
+                        subscribed_client = self.client
+
+                    if self._positions_dirty or time.monotonic() >= next_reconcile:
+                        self._positions_dirty = False
+                        self._run_cycle()
+                        next_reconcile = time.monotonic() + reconcile_seconds
+
+                    # Block until TWS pushes something (or the reconcile is due);
+                    # a timeout of 0 would mean "wait forever"
+                    timeout = max(next_reconcile - time.monotonic(), 1)
+                    self.client.ib.waitOnUpdate(timeout=timeout)
+                except KeyboardInterrupt:
+                    logger.info("Stopping monitor...")
+                    break
+                except Exception as e:
+                    logger.error(f"Error in monitor loop: {e}")
+                    time.sleep(60)
+        finally:
+            self.disconnect()
+
+
+def _setup_logging() -> logging.handlers.QueueListener:
+    """Route logging through a queue so writes happen off the sync path.
+
+    Returns:
+        The started listener that writes queued records to stderr.
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(
+        "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    ))
+    log_queue: queue.Queue = queue.Queue()
+    root = logging.getLogger()
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(logging.INFO)
+
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener
 
 
 def main():
@@ -246,22 +532,38 @@ def main():
     parser.add_argument(
         "--continuous", action="store_true", help="Run continuously"
     )
+    parser.add_argument(
+        "--events", action="store_true",
+        help="Run continuously, syncing on TWS position events",
+    )
     parser.add_argument(
         "--interval", type=int, default=5, help="Minutes between syncs (default: 5)"
     )
+    parser.add_argument(
+        "--reconcile", type=int, default=60,
+        help="With --events: minutes between catch-up syncs (default: 60)",
+    )
 
     args = parser.parse_args()
 
+    load_env()
+    listener = _setup_logging()
     tws_settings = TWSSettings(port=args.port)
     monitor = PositionMonitor(tws_settings=tws_settings)
 
-    if args.once:
-        monitor.run_once()
-    elif args.continuous:
-        monitor.run_continuous(interval_minutes=args.interval)
-    else:
-        # Default: run once
-        monitor.run_once()
+    try:
+        if args.once:
+            monitor.run_once()
+        elif args.events:
+            monitor.run_event_driven(reconcile_minutes=args.reconcile)
+        elif args.continuous:
+            monitor.run_continuous(interval_minutes=args.interval)
+        else:
+            # Default: run once
+            monitor.run_once()
+    finally:
+        # Flush anything still queued
+        listener.stop()
 
 
 if __name__ == "__main__":
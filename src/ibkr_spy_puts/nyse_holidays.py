@@ -0,0 +1,98 @@
+"""Pure-Python NYSE holiday rules.
+
+Computes the weekday full-day closures for a year from the exchange's
+holiday rules, so the common calendar path never has to import
+pandas_market_calendars. Rules are kept from FIRST_YEAR onwards; earlier
+years (and verification runs) go through the calendar library instead.
+"""
+
+from datetime import date, timedelta
+
+# Earliest year the rules below reproduce the exchange's closures
+FIRST_YEAR = 2000
+
+# One-off closures that no rule predicts (national days of mourning, etc.)
+SPECIAL_CLOSURES = frozenset({
+    date(2001, 9, 11),  # September 11 attacks
+    date(2001, 9, 12),
+    date(2001, 9, 13),
+    date(2001, 9, 14),
+    date(2004, 6, 11),  # President Reagan's funeral
+    date(2007, 1, 2),  # President Ford's funeral
+    date(2012, 10, 29),  # Hurricane Sandy
+    date(2012, 10, 30),
+    date(2018, 12, 5),  # President George H.W. Bush's funeral
+    date(2025, 1, 9),  # President Carter's funeral
+})
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """Get the nth given weekday of a month (Monday = 0)."""
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def _last_weekday(year: int, month: int, weekday: int) -> date:
+    """Get the last given weekday of a month (Monday = 0)."""
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _observed(d: date) -> date:
+    """Move a Saturday holiday to Friday and a Sunday holiday to Monday."""
+    if d.weekday() == 5:
+        return d - timedelta(days=1)
+    if d.weekday() == 6:
+        return d + timedelta(days=1)
+    return d
+
+
+def _easter(year: int) -> date:
+    """Get Western Easter Sunday (anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def compute_holidays(year: int) -> frozenset[date]:
+    """Compute the NYSE's weekday full-day closures for a year.
+
+    Args:
+        year: Year to compute, FIRST_YEAR or later.
+
+    Returns:
+        Weekday dates on which the exchange is closed.
+
+    Raises:
+        ValueError: If year is before FIRST_YEAR.
+    """
+    if year < FIRST_YEAR:
+        raise ValueError(f"NYSE holiday rules start in {FIRST_YEAR}, got {year}")
+
+    holidays = {
+        _nth_weekday(year, 1, 0, 3),  # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),  # Washington's Birthday
+        _easter(year) - timedelta(days=2),  # Good Friday
+        _last_weekday(year, 5, 0),  # Memorial Day
+        _observed(date(year, 7, 4)),  # Independence Day
+        _nth_weekday(year, 9, 0, 1),  # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving
+        _observed(date(year, 12, 25)),  # Christmas
+    }
+    # New Year's Day on a Saturday is not observed on the prior Friday
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # Juneteenth
+
+    holidays.update(d for d in SPECIAL_CLOSURES if d.year == year)
+    return frozenset(holidays)
@@ -4,49 +4,218 @@ Uses APScheduler to run the strategy at market open (configurable).
 Automatically skips weekends and US market holidays.
 """
 
+import asyncio
+import atexit
+import functools
 import logging
+import os
+import pickle
 import signal
 import sys
+import tempfile
+import threading
+import time as _time
+from bisect import bisect_left, bisect_right
 from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
 from pathlib import Path
-from typing import Callable
-
-# Load environment variables
-from dotenv import load_dotenv
-load_dotenv(Path(__file__).parent.parent.parent / ".env")
+from typing import TYPE_CHECKING, Callable
+from zoneinfo import ZoneInfo
+
+from ibkr_spy_puts.config import (
+    DatabaseSettings,
+    ExitOrderSettings,
+    ScheduleSettings,
+    StrategySettings,
+    TWSSettings,
+    load_env,
+)
+from ibkr_spy_puts.nyse_holidays import FIRST_YEAR, compute_holidays
 
-import pandas_market_calendars as mcal
-from apscheduler.schedulers.blocking import BlockingScheduler
-from apscheduler.triggers.cron import CronTrigger
+# pandas_market_calendars (pandas/numpy) and APScheduler are imported where
+# they are first needed, so importing this module stays cheap
+if TYPE_CHECKING:
+    import numpy as np
 
-from ibkr_spy_puts.config import ScheduleSettings, get_settings
+    from ibkr_spy_puts.database import Database
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
 logger = logging.getLogger(__name__)
 
 
+def configure_logging() -> None:
+    """Log INFO and above to stderr, unless logging is already configured.
+
+    Called by the entry points rather than at import, so importing this
+    module (e.g. from tests or the API) leaves the root logger alone.
+    """
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+
+
+# Precomputed session window: how far ahead it reaches and how often it is rebuilt
+SESSION_HORIZON_DAYS = 365
+SESSION_REFRESH_SECONDS = 7 * 24 * 60 * 60
+
+# Trading days scheduled ahead as one-off trade jobs (topped up nightly)
+TRADE_DAYS_AHEAD = 60
+
+# Weekday holidays by year, persisted so restarts skip the calendar computation
+HOLIDAY_CACHE_PATH = Path.home() / ".cache" / "ibkr_spy_puts" / "nyse_holidays.pkl"
+# Bump when the pickled layout changes; files with another version are ignored
+HOLIDAY_CACHE_VERSION = 1
+
+
 class MarketCalendar:
     """NYSE market calendar for holiday detection."""
 
-    def __init__(self):
-        """Initialize the NYSE calendar."""
-        self.nyse = mcal.get_calendar("NYSE")
-        # Cache valid trading days for performance
-        self._cache: dict[int, set[date]] = {}
-
-    def _get_trading_days_for_year(self, year: int) -> set[date]:
-        """Get all trading days for a year (cached)."""
-        if year not in self._cache:
-            start = f"{year}-01-01"
-            end = f"{year}-12-31"
-            schedule = self.nyse.schedule(start_date=start, end_date=end)
-            self._cache[year] = {d.date() for d in schedule.index}
-        return self._cache[year]
+    def __init__(
+        self,
+        cache_path: Path = HOLIDAY_CACHE_PATH,
+        dont_use_cache: bool = False,
+        today: Callable[[], date] = date.today,
+    ):
+        """Initialize the NYSE calendar.
+
+        Args:
+            cache_path: File the per-year holiday sets are persisted to.
+            dont_use_cache: If True, neither read nor write the cache file.
+            today: Clock used when no date is passed (injectable for tests).
+        """
+        self.today = today
+        self.cache_path = cache_path
+        self.dont_use_cache = dont_use_cache
+        # Weekday holidays per year; everything else Mon-Fri is a trading day
+        self._holidays: dict[int, frozenset[date]] = (
+            {} if dont_use_cache else self._load_holiday_cache()
+        )
+        self._all_holidays: "np.ndarray | None" = None
+        # Per year: (ordinal of Jan 1, one byte per day, 1 = trading day)
+        self._bitmaps: dict[int, tuple[int, bytes]] = {}
+        # Sorted session open/close times (UTC epoch seconds), see _ensure_sessions
+        self._session_opens: list[int] = []
+        self._session_closes: list[int] = []
+        self._sessions_built_at: float | None = None
+
+    @functools.cached_property
+    def nyse(self):
+        """The pandas_market_calendars NYSE calendar, loaded on first use.
+
+        Processes whose holidays all come from the cache file never import
+        pandas.
+        """
+        import pandas_market_calendars as mcal
+
+        return mcal.get_calendar("NYSE")
+
+    def _ensure_sessions(self, now_ts: float) -> None:
+        """Precompute upcoming session open/close times if stale.
+
+        The window covers SESSION_HORIZON_DAYS from the day before now_ts and
+        is rebuilt weekly, or when now_ts falls outside it, so lookups are
+        a bisect instead of a calendar library call.
+
+        Args:
+            now_ts: Current time as UTC epoch seconds.
+        """
+        if (
+            self._sessions_built_at is not None
+            and now_ts - self._sessions_built_at < SESSION_REFRESH_SECONDS
+            and self._session_opens
+            and self._session_opens[0] <= now_ts + 24 * 60 * 60
+            and now_ts < self._session_opens[-1]
+        ):
+            return
+
+        start = datetime.fromtimestamp(now_ts, tz=timezone.utc).date() - timedelta(days=1)
+        end = start + timedelta(days=SESSION_HORIZON_DAYS)
+        schedule = self.nyse.schedule(start_date=start, end_date=end)
+        self._session_opens = [int(ts.timestamp()) for ts in schedule["market_open"]]
+        self._session_closes = [int(ts.timestamp()) for ts in schedule["market_close"]]
+        self._sessions_built_at = now_ts
+
+    def _load_holiday_cache(self) -> dict[int, frozenset[date]]:
+        """Load persisted holiday sets, or an empty dict if unavailable."""
+        try:
+            with open(self.cache_path, "rb") as f:
+                cached = pickle.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable holiday cache {self.cache_path}: {e}")
+            return {}
+        if not isinstance(cached, dict) or cached.get("v") != HOLIDAY_CACHE_VERSION:
+            return {}
+        return cached["holidays"]
+
+    def _save_holiday_cache(self) -> None:
+        """Atomically write the holiday sets to the cache file."""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump({"v": HOLIDAY_CACHE_VERSION, "holidays": self._holidays}, f)
+                os.replace(tmp, self.cache_path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write holiday cache {self.cache_path}: {e}")
+
+    def _library_holidays(self, year: int) -> frozenset[date]:
+        """Get a year's weekday holidays from pandas_market_calendars.
+
+        Used before the built-in rules' FIRST_YEAR, or for every year when
+        USE_MCAL is set (to cross-check the rules).
+        """
+        import numpy as np
+
+        if self._all_holidays is None:
+            self._all_holidays = np.asarray(
+                self.nyse.holidays().holidays, dtype="datetime64[D]"
+            )
+        # Year range and weekday filter in one vectorized pass
+        mask = (
+            (self._all_holidays >= np.datetime64(f"{year}-01-01"))
+            & (self._all_holidays < np.datetime64(f"{year + 1}-01-01"))
+            & np.is_busday(self._all_holidays)
+        )
+        return frozenset(self._all_holidays[mask].tolist())
+
+    def _get_holidays_for_year(self, year: int) -> frozenset[date]:
+        """Get the weekday market holidays for a year (cached)."""
+        if year not in self._holidays:
+            if year >= FIRST_YEAR and not os.getenv("USE_MCAL"):
+                self._holidays[year] = compute_holidays(year)
+            else:
+                self._holidays[year] = self._library_holidays(year)
+            if not self.dont_use_cache:
+                self._save_holiday_cache()
+        return self._holidays[year]
+
+    def _get_trading_bitmap(self, year: int) -> tuple[int, bytes]:
+        """Get a year's trading days as a dense bitmap (cached).
+
+        Returns:
+            Tuple of (Jan 1 ordinal, bytes with 1 for each trading day).
+        """
+        if year not in self._bitmaps:
+            jan1 = date(year, 1, 1).toordinal()
+            days = date(year + 1, 1, 1).toordinal() - jan1
+            buf = bytearray(b"\x01" * days)
+            # Clear every Saturday and Sunday with strided slices
+            jan1_weekday = (jan1 - 1) % 7  # ordinal 1 (0001-01-01) is a Monday
+            for weekend_day in (5, 6):
+                first = (weekend_day - jan1_weekday) % 7
+                buf[first::7] = bytes(len(range(first, days, 7)))
+            for holiday in self._get_holidays_for_year(year):
+                buf[holiday.toordinal() - jan1] = 0
+            self._bitmaps[year] = (jan1, bytes(buf))
+        return self._bitmaps[year]
 
     def is_trading_day(self, check_date: date | None = None) -> bool:
         """Check if a date is a trading day.
@@ -58,10 +227,10 @@ class MarketCalendar:
             True if the date is a trading day.
         """
         if check_date is None:
-            check_date = date.today()
+            check_date = self.today()
 
-        trading_days = self._get_trading_days_for_year(check_date.year)
-        return check_date in trading_days
+        jan1, buf = self._get_trading_bitmap(check_date.year)
+        return buf[check_date.toordinal() - jan1] == 1
 
     def next_trading_day(self, from_date: date | None = None) -> date:
         """Get the next trading day.
@@ -73,41 +242,80 @@ class MarketCalendar:
             The next trading day (could be today if today is a trading day).
         """
         if from_date is None:
-            from_date = date.today()
+            from_date = self.today()
 
-        check_date = from_date
-        for _ in range(10):  # Max 10 days lookahead
-            if self.is_trading_day(check_date):
-                return check_date
-            check_date += timedelta(days=1)
+        year = from_date.year
+        offset = from_date.toordinal() - date(year, 1, 1).toordinal()
+        while True:
+            # First set byte at or after offset; otherwise carry into January
+            jan1, buf = self._get_trading_bitmap(year)
+            i = buf.find(1, offset)
+            if i >= 0:
+                return date.fromordinal(jan1 + i)
+            year, offset = year + 1, 0
 
-        # Fallback: return the next weekday
-        return check_date
+    def upcoming_trading_days(self, count: int, from_date: date | None = None) -> list[date]:
+        """Get the next count trading days, starting from a date.
 
-    def is_market_open(self) -> bool:
-        """Check if NYSE market is currently open.
+        Walks the year bitmaps by ordinal and only builds a date for each
+        trading day found.
 
-        Market hours: 9:30 AM - 4:00 PM Eastern Time on trading days.
+        Args:
+            count: Number of trading days to return.
+            from_date: First date to consider. Defaults to today.
 
         Returns:
-            True if market is currently open.
+            Trading days in ascending order (from_date included if trading).
         """
-        import pytz
+        if from_date is None:
+            from_date = self.today()
+
+        days: list[date] = []
+        year = from_date.year
+        offset = from_date.toordinal() - date(year, 1, 1).toordinal()
+        while len(days) < count:
+            jan1, buf = self._get_trading_bitmap(year)
+            i = buf.find(1, offset)
+            while i >= 0 and len(days) < count:
+                days.append(date.fromordinal(jan1 + i))
+                i = buf.find(1, i + 1)
+            year, offset = year + 1, 0
+        return days
+
+    def next_market_open(self, after: datetime | None = None) -> datetime | None:
+        """Get the next NYSE session open strictly after a given time.
 
-        # Get current time in Eastern timezone
-        eastern = pytz.timezone("America/New_York")
-        now = datetime.now(eastern)
-        today = now.date()
+        Args:
+            after: Timezone-aware reference time. Defaults to now.
+
+        Returns:
+            Next market open (UTC), or None if none within the horizon.
+        """
+        now_ts = (after or datetime.now(timezone.utc)).timestamp()
+        self._ensure_sessions(now_ts)
+
+        i = bisect_right(self._session_opens, now_ts)
+        if i == len(self._session_opens):
+            return None
+        return datetime.fromtimestamp(self._session_opens[i], tz=timezone.utc)
 
-        # Not a trading day (weekend or holiday)
-        if not self.is_trading_day(today):
-            return False
+    def is_market_open(self, at: datetime | None = None) -> bool:
+        """Check if NYSE market is currently open.
 
-        # Check market hours (9:30 AM - 4:00 PM ET)
-        market_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
-        market_close = now.replace(hour=16, minute=0, second=0, microsecond=0)
+        Uses the precomputed session times, so early closes are respected.
 
-        return market_open <= now <= market_close
+        Args:
+            at: Timezone-aware time to check. Defaults to now.
+
+        Returns:
+            True if market is currently open.
+        """
+        now_ts = (at or datetime.now(timezone.utc)).timestamp()
+        self._ensure_sessions(now_ts)
+
+        # Latest session that opened at or before now
+        i = bisect_right(self._session_opens, now_ts) - 1
+        return i >= 0 and now_ts <= self._session_closes[i]
 
     def get_holidays(self, year: int) -> list[date]:
         """Get all market holidays for a year.
@@ -118,22 +326,7 @@ class MarketCalendar:
         Returns:
             List of holiday dates.
         """
-        # Get all weekdays in the year
-        start = date(year, 1, 1)
-        end = date(year, 12, 31)
-        all_weekdays = set()
-        current = start
-        while current <= end:
-            if current.weekday() < 5:  # Monday = 0, Friday = 4
-                all_weekdays.add(current)
-            current += timedelta(days=1)
-
-        # Trading days
-        trading_days = self._get_trading_days_for_year(year)
-
-        # Holidays = weekdays that are not trading days
-        holidays = sorted(all_weekdays - trading_days)
-        return holidays
+        return sorted(self._get_holidays_for_year(year))
 
 
 class TradingScheduler:
@@ -154,17 +347,87 @@ class TradingScheduler:
             force_run: If True, bypass trading day check (for testing on weekends).
             snapshot_func: Function to call at market close for daily snapshot.
         """
+        from apscheduler.events import (
+            EVENT_JOB_ERROR,
+            EVENT_JOB_EXECUTED,
+            EVENT_JOB_SUBMITTED,
+        )
+        from apscheduler.schedulers.blocking import BlockingScheduler
+        from apscheduler.triggers.cron import CronTrigger
+
         self.trade_func = trade_func
         self.snapshot_func = snapshot_func
         self.settings = settings or ScheduleSettings()
         self.force_run = force_run
+        # Parsed once; a bad SCHEDULE_TRADE_TIME fails here, not in start()
+        self._hour, self._minute = self._parse_trade_time(self.settings.trade_time)
         self.calendar = MarketCalendar()
-        self.scheduler = BlockingScheduler(timezone=self.settings.timezone)
+        self._today_trading_cache: tuple[date, bool] | None = None
+
+        # Resolved once and passed to the scheduler and every trigger, so no
+        # trigger can fall back to the system timezone
+        self._tz = ZoneInfo(self.settings.timezone)
+        self.scheduler = BlockingScheduler(timezone=self._tz)
+
+        # Triggers depend only on settings, so build them once here
+        # Every day if force_run is enabled, else weekdays
+        day_of_week = "mon-sun" if force_run else "mon-fri"
+        # Only force_run uses a cron trade job; otherwise see _schedule_trading_days
+        self._trade_trigger = (
+            CronTrigger(hour=self._hour, minute=self._minute, timezone=self._tz)
+            if force_run
+            else None
+        )
+        self._snapshot_trigger = CronTrigger(
+            day_of_week=day_of_week,
+            hour=16,
+            minute=5,  # 4:05 PM to ensure market is fully closed
+            timezone=self._tz,
+        )
+        self._refill_trigger = CronTrigger(hour=23, minute=0, timezone=self._tz)
+        self._prefetch_trigger = CronTrigger(month=12, day=15, timezone=self._tz)
+
+        # Shutdown waits for running jobs (e.g. a trade mid-placement)
+        self._shutdown_requested = threading.Event()
+        self._jobs_lock = threading.Lock()
+        self._active_jobs = 0
+        self.scheduler.add_listener(
+            self._on_job_event,
+            EVENT_JOB_SUBMITTED | EVENT_JOB_EXECUTED | EVENT_JOB_ERROR,
+        )
         self._setup_signal_handlers()
+        self._prefetch_holidays()
+
+    def _on_job_event(self, event):
+        """Track running jobs and finish a requested shutdown once idle."""
+        from apscheduler.events import EVENT_JOB_SUBMITTED
+
+        with self._jobs_lock:
+            if event.code == EVENT_JOB_SUBMITTED:
+                self._active_jobs += 1
+                return
+            self._active_jobs -= 1
+            stop = self._active_jobs == 0 and self._shutdown_requested.is_set()
+        if stop:
+            logger.info("Running job finished, stopping scheduler...")
+            self.stop()
 
     def _setup_signal_handlers(self):
-        """Setup graceful shutdown handlers."""
+        """Setup graceful shutdown handlers.
+
+        The first signal stops the scheduler once running jobs finish, so
+        an in-flight trade isn't cut off mid-order; a second one exits now.
+        """
         def shutdown(signum, frame):
+            # Check and set under one lock so a job finishing in between
+            # can't miss the request
+            with self._jobs_lock:
+                defer = self._active_jobs > 0 and not self._shutdown_requested.is_set()
+                if defer:
+                    self._shutdown_requested.set()
+            if defer:
+                logger.info("Received shutdown signal, stopping after running job finishes...")
+                return
             logger.info("Received shutdown signal, stopping scheduler...")
             self.stop()
             sys.exit(0)
@@ -172,11 +435,32 @@ class TradingScheduler:
         signal.signal(signal.SIGINT, shutdown)
         signal.signal(signal.SIGTERM, shutdown)
 
+    def _prefetch_holidays(self):
+        """Load this year's and next year's holidays off the trade path."""
+        year = self.calendar.today().year
+        for y in (year, year + 1):
+            self.calendar._get_holidays_for_year(y)
+
+    def _today_trading(self) -> tuple[date, bool]:
+        """Get today's date and whether it is a trading day.
+
+        The answer is kept for the rest of the day, so the trade and
+        snapshot jobs share one calendar lookup.
+
+        Returns:
+            Tuple of (today, is trading day).
+        """
+        today = self.calendar.today()
+        cached = self._today_trading_cache
+        if cached is None or cached[0] != today:
+            cached = self._today_trading_cache = (today, self.calendar.is_trading_day(today))
+        return cached
+
     def _execute_trade(self):
         """Execute the trade if today is a trading day."""
-        today = date.today()
+        today, is_trading = self._today_trading()
 
-        if not self.calendar.is_trading_day(today):
+        if not is_trading:
             if self.force_run:
                 logger.warning(f"Force running trade on non-trading day: {today}")
             else:
@@ -192,9 +476,9 @@ class TradingScheduler:
 
     def _execute_snapshot(self):
         """Execute the daily snapshot if today is a trading day."""
-        today = date.today()
+        today, is_trading = self._today_trading()
 
-        if not self.calendar.is_trading_day(today):
+        if not is_trading:
             if self.force_run:
                 logger.warning(f"Force running snapshot on non-trading day: {today}")
             else:
@@ -212,67 +496,119 @@ class TradingScheduler:
         except Exception as e:
             logger.error(f"Snapshot capture failed: {e}", exc_info=True)
 
-    def _parse_trade_time(self) -> tuple[int, int]:
-        """Parse trade time from settings.
+    @staticmethod
+    def _parse_trade_time(trade_time: str) -> tuple[int, int]:
+        """Parse a trade time like "09:30" (or just "9").
+
+        Args:
+            trade_time: Time of day as HH[:MM].
 
         Returns:
             Tuple of (hour, minute).
+
+        Raises:
+            ValueError: If the string is not a valid time of day.
         """
-        parts = self.settings.trade_time.split(":")
+        parts = trade_time.split(":")
+        if len(parts) > 2:
+            raise ValueError(f"Invalid trade time: {trade_time!r}")
         hour = int(parts[0])
         minute = int(parts[1]) if len(parts) > 1 else 0
+        if not (0 <= hour < 24 and 0 <= minute < 60):
+            raise ValueError(f"Invalid trade time: {trade_time!r}")
         return hour, minute
 
+    def _schedule_trading_days(self):
+        """Add a one-off trade job for each of the next TRADE_DAYS_AHEAD trading days.
+
+        Holidays and weekends get no job, so the scheduler never wakes on
+        them. Executed jobs remove themselves; re-running tops the window up
+        (existing days are replaced, not duplicated).
+        """
+        from apscheduler.triggers.date import DateTrigger
+
+        hour, minute = self._hour, self._minute
+        now = datetime.now(self._tz)
+        for day in self.calendar.upcoming_trading_days(TRADE_DAYS_AHEAD, now.date()):
+            run_at = datetime.combine(day, time(hour, minute), tzinfo=self._tz)
+            if run_at > now:
+                self.scheduler.add_job(
+                    self._execute_trade,
+                    trigger=DateTrigger(run_date=run_at),
+                    id=f"trade-{day.isoformat()}",
+                    name="Daily Put Selling",
+                    replace_existing=True,
+                    misfire_grace_time=3700,  # 1h+: survive DST transitions
+                    coalesce=True,  # several missed fires (e.g. after sleep) run once
+                    max_instances=1,
+                )
+
     def start(self):
         """Start the scheduler."""
-        hour, minute = self._parse_trade_time()
+        hour, minute = self._hour, self._minute
 
-        # Schedule: Monday-Friday normally, or all days if force_run is enabled
-        day_of_week = "mon-sun" if self.force_run else "mon-fri"
-        trigger = CronTrigger(
-            day_of_week=day_of_week,
-            hour=hour,
-            minute=minute,
-            timezone=self.settings.timezone,
-        )
-
-        self.scheduler.add_job(
-            self._execute_trade,
-            trigger=trigger,
-            id="daily_trade",
-            name="Daily Put Selling",
-            replace_existing=True,
-            misfire_grace_time=3700,  # 1h+: survive DST transitions
-        )
+        # Schedule: every day if force_run is enabled, else trading days only
+        if self.force_run:
+            self.scheduler.add_job(
+                self._execute_trade,
+                trigger=self._trade_trigger,
+                id="daily_trade",
+                name="Daily Put Selling",
+                replace_existing=True,
+                misfire_grace_time=3700,  # 1h+: survive DST transitions
+                coalesce=True,  # several missed fires (e.g. after sleep) run once
+                max_instances=1,
+            )
+        else:
+            self._schedule_trading_days()
+            self.scheduler.add_job(
+                self._schedule_trading_days,
+                trigger=self._refill_trigger,
+                id="trade_refill",
+                name="Trade Schedule Refill",
+                replace_existing=True,
+            )
 
         # Schedule daily snapshot at market close (4:00 PM ET)
         if self.snapshot_func:
-            snapshot_trigger = CronTrigger(
-                day_of_week=day_of_week,
-                hour=16,
-                minute=5,  # 4:05 PM to ensure market is fully closed
-                timezone=self.settings.timezone,
-            )
             self.scheduler.add_job(
                 self._execute_snapshot,
-                trigger=snapshot_trigger,
+                trigger=self._snapshot_trigger,
                 id="daily_snapshot",
                 name="Daily Book Snapshot",
                 replace_existing=True,
                 misfire_grace_time=3700,  # 1h+: survive DST transitions
+                coalesce=True,  # several missed fires (e.g. after sleep) run once
+                max_instances=1,
             )
             logger.info(f"Snapshot scheduled: 16:05 {self.settings.timezone}")
 
+        # Warm next year's holidays in December so January never hits a cold cache
+        self.scheduler.add_job(
+            self._prefetch_holidays,
+            trigger=self._prefetch_trigger,
+            id="holiday_prefetch",
+            name="Holiday Prefetch",
+            replace_existing=True,
+        )
+
         next_run = self.get_next_run_time()
         if next_run:
+            if next_run.tzinfo != self._tz:
+                logger.warning(f"Next trade {next_run} is not in {self._tz}")
             logger.info(f"Scheduler started. Next trade: {next_run}")
         else:
             logger.info(f"Scheduler started. Waiting for next scheduled time...")
         logger.info(f"Trade time: {hour:02d}:{minute:02d} {self.settings.timezone}")
+        next_open = self.calendar.next_market_open()
+        if next_open:
+            logger.info(f"Next market open: {next_open.astimezone(self._tz)}")
 
         # Print upcoming holidays
-        holidays = self.calendar.get_holidays(date.today().year)
-        upcoming = [h for h in holidays if h >= date.today()][:5]
+        today = self.calendar.today()
+        holidays = self.calendar.get_holidays(today.year)
+        i = bisect_left(holidays, today)
+        upcoming = holidays[i:i + 5]
         if upcoming:
             logger.info(f"Upcoming market holidays: {', '.join(str(h) for h in upcoming)}")
 
@@ -293,15 +629,19 @@ class TradingScheduler:
         Returns:
             Next run datetime or None if not scheduled.
         """
-        job = self.scheduler.get_job("daily_trade")
-        if job:
+        run_times = []
+        for job in self.scheduler.get_jobs():
+            if job.id != "daily_trade" and not job.id.startswith("trade-"):
+                continue
             # APScheduler 4.x uses different API
             try:
-                return job.next_run_time
+                next_run = job.next_run_time
             except AttributeError:
-                # Fallback for newer APScheduler versions
-                return None
-        return None
+                # Fallback for newer APScheduler versions (or not yet started)
+                continue
+            if next_run:
+                run_times.append(next_run)
+        return min(run_times, default=None)
 
     def run_now(self):
         """Run the trade immediately (for testing)."""
@@ -314,10 +654,20 @@ class TradingScheduler:
         self._execute_snapshot()
 
 
+def _ensure_database(db: "Database") -> bool:
+    """Connect db unless its current connection still answers.
+
+    Returns:
+        True if db is connected and usable.
+    """
+    return db.is_alive() or db.connect()
+
+
 def create_trade_function(
     use_mock: bool = False,
     dry_run: bool = False,
     port: int | None = None,
+    db: "Database | None" = None,
 ) -> Callable[[], None]:
     """Create the trade function for the scheduler.
 
@@ -325,45 +675,60 @@ def create_trade_function(
         use_mock: Use mock client.
         dry_run: Don't actually place orders.
         port: TWS port override.
+        db: Long-lived database shared with other jobs. It is reconnected
+            when needed and left open after each run. If None, each run
+            opens and closes its own connection.
 
     Returns:
         Trade function that can be called by the scheduler.
     """
+    # Resolve dependencies once, so a broken install fails at scheduler
+    # start rather than at the first scheduled trade
+    from ibkr_spy_puts.database import Database, Position, Trade
+    from ibkr_spy_puts.strategy import ExitPrices, PutSellingStrategy
+
+    if use_mock:
+        from ibkr_spy_puts.mock_client import MockIBKRClient as client_cls
+    else:
+        from ibkr_spy_puts.ibkr_client import IBKRClient as client_cls
+
+    # Settings don't change between runs; parse each once
+    strategy_settings = StrategySettings()
+    exit_settings = ExitOrderSettings()
+    db_settings = DatabaseSettings()
+    tws_settings = None
+    if not use_mock:
+        tws_settings = TWSSettings(port=port) if port is not None else TWSSettings()
+
+    shared_db = db
+
+    # One event loop for every run; APScheduler may call trade() from a
+    # different worker thread each day, so it is bound to the caller per run
+    loop: asyncio.AbstractEventLoop | None = None
+
     def trade():
-        import asyncio
+        nonlocal loop
 
-        # ib_insync requires an event loop - create one for this thread BEFORE imports
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        # One clock read per run so trade date and fallback fill time agree
+        now = datetime.now().astimezone()
+        today = now.date()
 
-        from decimal import Decimal
-        from ibkr_spy_puts.config import ExitOrderSettings, DatabaseSettings, TWSSettings
-        from ibkr_spy_puts.database import Database, Position, Trade
-        from ibkr_spy_puts.strategy import PutSellingStrategy
+        # ib_insync requires an event loop in the calling thread
+        if loop is None or loop.is_closed():
+            loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
 
         # Create client
-        if use_mock:
-            from ibkr_spy_puts.mock_client import MockIBKRClient
-            client = MockIBKRClient()
-        else:
-            from ibkr_spy_puts.ibkr_client import IBKRClient
-            settings = TWSSettings()
-            if port:
-                settings = TWSSettings(port=port)
-            client = IBKRClient(settings=settings)
+        client = client_cls() if use_mock else client_cls(settings=tws_settings)
 
         # Connect to database
-        db = Database(settings=DatabaseSettings())
-        if not db.connect():
+        db = shared_db or Database(settings=db_settings)
+        if not _ensure_database(db):
             logger.error("Failed to connect to database")
             return
         logger.info("Connected to database")
 
         # Connect to TWS with retries
-        import time as _time
         connected = False
         for attempt in range(3):
             logger.info(f"Connecting to TWS (attempt {attempt + 1}/3)...")
@@ -375,11 +740,16 @@ def create_trade_function(
 
         if not connected:
             logger.error("Failed to connect to TWS after 3 attempts")
-            db.disconnect()
+            if db is not shared_db:
+                db.disconnect()
             return
 
+        # Close the TWS socket even if the process exits before the finally
+        # below runs, so the next start doesn't wait out a stale session
+        atexit.register(client.disconnect)
+
         try:
-            strategy = PutSellingStrategy(client)
+            strategy = PutSellingStrategy(client, strategy_settings, exit_settings)
             trade_order, result = strategy.run(dry_run=dry_run)
 
             if trade_order:
@@ -398,17 +768,19 @@ def create_trade_function(
                     logger.info(f"Using actual fill price: {entry_price} (limit was {trade_order.limit_price})")
 
                 # Recalculate TP/SL based on actual entry price
-                from ibkr_spy_puts.strategy import ExitPrices
-                exit_settings = ExitOrderSettings()
-                actual_exit_prices = ExitPrices.calculate(
-                    sell_price=entry_price,
-                    take_profit_pct=exit_settings.take_profit_pct,
-                    stop_loss_pct=exit_settings.stop_loss_pct,
+                actual_exit_prices = ExitPrices.from_factors(
+                    entry_price,
+                    take_profit_factor=exit_settings.take_profit_factor,
+                    stop_loss_factor=exit_settings.stop_loss_factor,
                 )
 
+                # Convert to Decimal once for both the trade and position rows
+                strike = Decimal(str(trade_order.option.strike))
+                entry = Decimal(str(entry_price))
+
                 # Extract commission and fill time
                 commission = Decimal("0")
-                fill_time = datetime.now(timezone.utc)
+                fill_time = now
 
                 # Use commission from BracketOrderResult (extracted in ibkr_client)
                 if result.commission is not None:
@@ -424,34 +796,38 @@ def create_trade_function(
 
                 # Log to trades table (execution history)
                 db_trade = Trade(
-                    trade_date=date.today(),
+                    trade_date=today,
                     symbol=trade_order.option.symbol,
-                    strike=Decimal(str(trade_order.option.strike)),
+                    strike=strike,
                     expiration=trade_order.option.expiration,
                     quantity=trade_order.quantity,
                     action="SELL",
-                    price=Decimal(str(entry_price)),
+                    price=entry,
                     fill_time=fill_time,
                     commission=commission,
                     strategy_id="spy-put-selling",
                 )
-                trade_id = db.insert_trade(db_trade)
-                logger.info(f"Logged trade execution: ID={trade_id}")
 
                 # Create position record (the book)
                 position = Position(
                     symbol=trade_order.option.symbol,
-                    strike=Decimal(str(trade_order.option.strike)),
+                    strike=strike,
                     expiration=trade_order.option.expiration,
                     quantity=trade_order.quantity,
-                    entry_price=Decimal(str(entry_price)),
+                    entry_price=entry,
                     entry_time=fill_time,  # Use actual fill time from execution
                     expected_tp_price=Decimal(str(actual_exit_prices.take_profit_price)),
                     expected_sl_price=Decimal(str(actual_exit_prices.stop_loss_price)),
                     status="OPEN",
                     strategy_id="spy-put-selling",
                 )
-                position_id = db.insert_position(position)
+
+                # One commit for both rows: the book never holds a position
+                # without its trade (or vice versa)
+                with db.transaction():
+                    trade_id = db.insert_trade(db_trade)
+                    position_id = db.insert_position(position)
+                logger.info(f"Logged trade execution: ID={trade_id}")
                 logger.info(f"Created position: ID={position_id}")
 
                 # Orders are live in IBKR - not persisted to database
@@ -467,96 +843,117 @@ def create_trade_function(
 
         finally:
             client.disconnect()
-            db.disconnect()
-            logger.info("Disconnected from TWS and database")
+            atexit.unregister(client.disconnect)
+            if db is not shared_db:
+                db.disconnect()
+            logger.info("Disconnected from TWS")
 
     return trade
 
 
-def create_snapshot_function(port: int | None = None) -> Callable[[], None]:
+CENTS = Decimal("0.01")
+FOUR_PLACES = Decimal("0.0001")
+SIX_PLACES = Decimal("0.000001")
+
+
+def _snapshot_decimal(total: float, places: Decimal) -> Decimal | None:
+    """Convert a summed float to a column-scale Decimal, or None if zero."""
+    return Decimal(str(total)).quantize(places) if total else None
+
+
+def create_snapshot_function(
+    port: int | None = None,
+    db: "Database | None" = None,
+) -> Callable[[], None]:
     """Create the snapshot function for the scheduler.
 
     Uses the connection manager's cached data instead of creating a new connection.
 
     Args:
         port: TWS port override (ignored - uses connection manager).
+        db: Long-lived database shared with other jobs (see
+            create_trade_function). If None, each run opens its own.
 
     Returns:
         Snapshot function that can be called by the scheduler.
     """
-    def capture_snapshot():
-        from decimal import Decimal
-        from ibkr_spy_puts.config import DatabaseSettings
-        from ibkr_spy_puts.database import BookSnapshot, Database
-        from ibkr_spy_puts.connection_manager import get_connection_manager
+    # As in create_trade_function: resolve dependencies and settings once
+    from ibkr_spy_puts.connection_manager import get_connection_manager
+    from ibkr_spy_puts.database import BookSnapshot, Database
 
-        # Get data from connection manager (already cached)
-        manager = get_connection_manager()
-        positions = manager.get_positions()
-        spy_data = manager.get_spy_price()
+    db_settings = DatabaseSettings()
+    shared_db = db
 
-        if not positions:
-            logger.warning("No positions in cache for snapshot")
+    def capture_snapshot():
+        # One clock read so the snapshot's date and time always agree
+        now = datetime.now().astimezone()
 
         # Connect to database
-        db = Database(settings=DatabaseSettings())
-        if not db.connect():
+        db = shared_db or Database(settings=db_settings)
+        if not _ensure_database(db):
             logger.error("Failed to connect to database for snapshot")
             return
         logger.info("Connected to database for snapshot capture")
 
         try:
+            # Get data from connection manager (already cached)
+            manager = get_connection_manager()
+            spy_data = manager.get_spy_price()
+            positions = manager.get_positions()
+            if not positions:
+                logger.warning("No positions in cache for snapshot")
+
             # Aggregate from cached positions
+            # Sum as floats (the cache holds IBKR floats) and convert once
+            open_positions = len(positions)
             total_contracts = sum(p.get("quantity", 0) for p in positions)
-            total_delta = Decimal("0")
-            total_theta = Decimal("0")
-            total_gamma = Decimal("0")
-            total_vega = Decimal("0")
-            total_unrealized_pnl = Decimal("0")
-            total_margin = Decimal("0")
+            delta = theta = gamma = vega = unrealized_pnl = margin = 0.0
 
             for pos in positions:
                 qty = pos.get("quantity", 0)
-                if pos.get("delta"):
-                    total_delta += Decimal(str(pos["delta"])) * qty
-                if pos.get("theta"):
-                    total_theta += Decimal(str(pos["theta"])) * qty
-                if pos.get("gamma"):
-                    total_gamma += Decimal(str(pos["gamma"])) * qty
-                if pos.get("vega"):
-                    total_vega += Decimal(str(pos["vega"])) * qty
-                if pos.get("unrealized_pnl"):
-                    total_unrealized_pnl += Decimal(str(pos["unrealized_pnl"]))
-                if pos.get("margin"):
-                    total_margin += Decimal(str(pos["margin"])) * qty
+                delta += (pos.get("delta") or 0.0) * qty
+                theta += (pos.get("theta") or 0.0) * qty
+                gamma += (pos.get("gamma") or 0.0) * qty
+                vega += (pos.get("vega") or 0.0) * qty
+                unrealized_pnl += pos.get("unrealized_pnl") or 0.0
+                margin += (pos.get("margin") or 0.0) * qty
+
+            # Quantized to the book_snapshots column scales
+            total_delta = _snapshot_decimal(delta, FOUR_PLACES)
+            total_theta = _snapshot_decimal(theta, FOUR_PLACES)
+            total_gamma = _snapshot_decimal(gamma, SIX_PLACES)
+            total_vega = _snapshot_decimal(vega, FOUR_PLACES)
+            total_unrealized_pnl = _snapshot_decimal(unrealized_pnl, CENTS)
+            total_margin = _snapshot_decimal(margin, CENTS)
 
             # Get SPY price from cache
             spy_price = spy_data.get("price")
 
             # Create and save snapshot
             snapshot = BookSnapshot(
-                snapshot_date=date.today(),
-                snapshot_time=datetime.now(timezone.utc),
-                open_positions=len(positions),
+                snapshot_date=now.date(),
+                snapshot_time=now,
+                open_positions=open_positions,
                 total_contracts=total_contracts,
-                total_delta=total_delta if total_delta else None,
-                total_theta=total_theta if total_theta else None,
-                total_gamma=total_gamma if total_gamma else None,
-                total_vega=total_vega if total_vega else None,
-                unrealized_pnl=total_unrealized_pnl if total_unrealized_pnl else None,
-                maintenance_margin=total_margin if total_margin else None,
+                total_delta=total_delta,
+                total_theta=total_theta,
+                total_gamma=total_gamma,
+                total_vega=total_vega,
+                unrealized_pnl=total_unrealized_pnl,
+                maintenance_margin=total_margin,
                 spy_price=Decimal(str(spy_price)) if spy_price else None,
             )
 
             snapshot_id = db.insert_snapshot(snapshot)
             logger.info(f"Book snapshot saved: ID={snapshot_id}")
-            logger.info(f"  Positions: {len(positions)}, Contracts: {total_contracts}")
+            logger.info(f"  Positions: {open_positions}, Contracts: {total_contracts}")
             logger.info(f"  Delta: {total_delta}, Theta: {total_theta}")
             logger.info(f"  Maintenance Margin: {total_margin}")
             logger.info(f"  SPY: {spy_price}")
 
         finally:
-            db.disconnect()
+            if db is not shared_db:
+                db.disconnect()
             logger.info("Snapshot capture complete")
 
     return capture_snapshot
@@ -578,27 +975,32 @@ def run_scheduler(
         run_immediately: Execute trade immediately before starting scheduler.
         force_run: Bypass trading day check (for weekend testing).
     """
-    # Reload settings after dotenv is loaded
-    import os
-    schedule_settings = ScheduleSettings(
-        trade_time=os.getenv("SCHEDULE_TRADE_TIME", "09:30"),
-        timezone=os.getenv("SCHEDULE_TIMEZONE", "America/New_York"),
-    )
+    configure_logging()
+    load_env()
+
+    # Build settings after dotenv is loaded (reads SCHEDULE_* itself)
+    schedule_settings = ScheduleSettings()
 
     # Check for force run from environment
-    force_run = force_run or os.getenv("FORCE_RUN", "").lower() in ("true", "1", "yes")
+    force_run = force_run or os.environ.get("FORCE_RUN", "").lower() in ("true", "1", "yes")
+
+    # One database connection for both daily jobs, closed at exit
+    from ibkr_spy_puts.database import Database
+
+    db = Database(settings=DatabaseSettings())
+    atexit.register(db.disconnect)
 
-    settings = get_settings()
     trade_func = create_trade_function(
         use_mock=use_mock,
         dry_run=dry_run,
         port=port,
+        db=db,
     )
 
     # Create snapshot function (skip for mock mode)
     snapshot_func = None
     if not use_mock:
-        snapshot_func = create_snapshot_function(port=port)
+        snapshot_func = create_snapshot_function(port=port, db=db)
 
     scheduler = TradingScheduler(
         trade_func=trade_func,
@@ -613,7 +1015,7 @@ def run_scheduler(
     logger.info(f"Mode: {'MOCK' if use_mock else 'LIVE'}")
     logger.info(f"Dry Run: {dry_run}")
     if not use_mock:
-        logger.info(f"TWS Port: {port or settings.tws.port}")
+        logger.info(f"TWS Port: {port if port is not None else TWSSettings().port}")
     logger.info(f"Run Immediately: {run_immediately}")
     if force_run:
         logger.warning("Force Run: ENABLED (will run on non-trading days)")
@@ -6,21 +6,53 @@ This module contains the core logic for:
 - Tracking trade execution
 """
 
-from dataclasses import dataclass
+import logging
+import sys
+import time
+from dataclasses import dataclass, replace
 from datetime import datetime
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
 
 from ibkr_spy_puts.config import ExitOrderSettings, StrategySettings
 from ibkr_spy_puts.ibkr_client import TradeResult as IBKRTradeResult, OptionContract
 
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+def _to_cents(price: float) -> int:
+    """Convert a dollar price to whole cents."""
+    return round(price * 100)
+
+
+@dataclass(slots=True, frozen=True)
 class ExitPrices:
-    """Calculated exit order prices (take profit and stop loss)."""
+    """Calculated exit order prices (take profit and stop loss), in whole cents.
+
+    The *_price properties give dollars for the client and database.
+    """
 
-    sell_price: float  # Price we're selling the put at
-    take_profit_price: float  # Buy back price for profit (lower)
-    stop_loss_price: float  # Buy back price for stop loss (higher)
+    sell_cents: int  # Price we're selling the put at
+    take_profit_cents: int  # Buy back price for profit (lower)
+    stop_loss_cents: int  # Buy back price for stop loss (higher)
+
+    @property
+    def sell_price(self) -> float:
+        """Sell price in dollars."""
+        return self.sell_cents / 100
+
+    @property
+    def take_profit_price(self) -> float:
+        """Take profit price in dollars."""
+        return self.take_profit_cents / 100
+
+    @property
+    def stop_loss_price(self) -> float:
+        """Stop loss price in dollars."""
+        return self.stop_loss_cents / 100
 
     @classmethod
     def calculate(
@@ -44,17 +76,80 @@ class ExitPrices:
             take_profit_price = 1.00 * (1 - 0.60) = 0.40 (buy back at $0.40)
             stop_loss_price = 1.00 * (1 + 2.00) = 3.00 (buy back at $3.00)
         """
-        take_profit_price = sell_price * (1 - take_profit_pct / 100)
-        stop_loss_price = sell_price * (1 + stop_loss_pct / 100)
+        return cls.from_factors(
+            sell_price,
+            take_profit_factor=1 - take_profit_pct / 100,
+            stop_loss_factor=1 + stop_loss_pct / 100,
+        )
+
+    @classmethod
+    def from_factors(
+        cls,
+        sell_price: float,
+        take_profit_factor: float,
+        stop_loss_factor: float,
+    ) -> "ExitPrices":
+        """Calculate exit prices from precomputed price multipliers.
 
+        Args:
+            sell_price: The price we're selling the put at.
+            take_profit_factor: Multiplier for the TP price (1 - take_profit_pct / 100).
+            stop_loss_factor: Multiplier for the SL price (1 + stop_loss_pct / 100).
+
+        Returns:
+            ExitPrices with calculated take profit and stop loss.
+        """
+        sell_cents = _to_cents(sell_price)
         return cls(
-            sell_price=sell_price,
-            take_profit_price=take_profit_price,
-            stop_loss_price=stop_loss_price,
+            sell_cents=sell_cents,
+            take_profit_cents=round(sell_cents * take_profit_factor),
+            stop_loss_cents=round(sell_cents * stop_loss_factor),
+        )
+
+    @staticmethod
+    def calculate_batch(
+        sell_prices: "npt.ArrayLike",
+        take_profit_pcts: "npt.ArrayLike",
+        stop_loss_pcts: "npt.ArrayLike",
+    ) -> tuple["np.ndarray", "np.ndarray"]:
+        """Calculate exit prices for many combinations at once.
+
+        Vectorized counterpart of calculate() for parameter sweeps; inputs
+        broadcast against each other, so a grid can be built by giving each
+        axis its own dimension.
+
+        Args:
+            sell_prices: Sell price(s).
+            take_profit_pcts: Profit percentage(s).
+            stop_loss_pcts: Loss percentage(s).
+
+        Returns:
+            Tuple of (take_profit_prices, stop_loss_prices) arrays, in dollars rounded to the cent.
+
+        Example:
+            tp, sl = ExitPrices.calculate_batch(
+                np.array([0.5, 1.0])[:, None, None],
+                np.array([50, 60])[None, :, None],
+                np.array([150, 200])[None, None, :],
+            )  # both shaped (2, 2, 2)
+        """
+        # numpy comes with pandas_market_calendars; only sweeps need it
+        import numpy as np
+
+        sell, take_profit_pct, stop_loss_pct = np.broadcast_arrays(
+            np.asarray(sell_prices, dtype=float),
+            np.asarray(take_profit_pcts, dtype=float),
+            np.asarray(stop_loss_pcts, dtype=float),
+        )
+        # Same whole-cent rounding as from_factors (np.rint rounds half to even, like round())
+        sell_cents = np.rint(sell * 100)
+        return (
+            np.rint(sell_cents * (1 - take_profit_pct / 100)) / 100,
+            np.rint(sell_cents * (1 + stop_loss_pct / 100)) / 100,
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradeOrder:
     """Represents a planned trade order."""
 
@@ -64,9 +159,27 @@ class TradeOrder:
     order_type: str  # "LMT" or "MKT"
     limit_price: float | None
     exit_prices: ExitPrices | None
+    use_exit_orders: bool = False  # Place TP/SL exit orders after the fill
+
+    def __post_init__(self):
+        """Intern the order's code strings and reject orders the client could not place.
+
+        order_type usually comes from the environment, so interning lets the
+        comparisons against literals below and in the client short-circuit.
+
+        Raises:
+            ValueError: If a limit order has no limit price, or exit orders
+                are requested without exit prices.
+        """
+        object.__setattr__(self, "action", sys.intern(self.action))
+        object.__setattr__(self, "order_type", sys.intern(self.order_type))
+        if self.order_type == "LMT" and self.limit_price is None:
+            raise ValueError("Limit order requires limit price")
+        if self.use_exit_orders and self.exit_prices is None:
+            raise ValueError("Exit orders enabled but no exit prices calculated")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradeResult:
     """Result of a trade execution."""
 
@@ -76,12 +189,66 @@ class TradeResult:
     take_profit_order_id: int | None
     stop_loss_order_id: int | None
     message: str
-    timestamp: datetime
+    timestamp_ns: int  # time.time_ns() when the result was decided
     fill_price: float | None = None
     cancelled_orders: list | None = None  # Orders cancelled for conflict, to be restored
     commission: float | None = None  # Commission from the trade
     sell_trade: any = None  # The IB Trade object for accessing fill details
 
+    @property
+    def timestamp(self) -> datetime:
+        """Local time the result was decided, built from timestamp_ns on demand."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+
+
+# Failed results differ only in message, timestamp_ns and the odd order ID;
+# derive them from one template instead of spelling out every empty field
+_FAILED_RESULT = TradeResult(
+    success=False,
+    order_id=None,
+    sell_order_id=None,
+    take_profit_order_id=None,
+    stop_loss_order_id=None,
+    message="",
+    timestamp_ns=0,
+)
+
+# Dry runs only vary in when they happened
+_DRY_RUN_RESULT = TradeResult(
+    success=True,
+    order_id=None,
+    sell_order_id=None,
+    take_profit_order_id=None,
+    stop_loss_order_id=None,
+    message="DRY RUN - Order not placed",
+    timestamp_ns=0,
+)
+
+
+# describe_trade() pieces; optional sections are appended only when present
+_SUMMARY_RULE = "=" * 60
+_SUMMARY_TEMPLATE = (
+    f"{_SUMMARY_RULE}\n"
+    "TRADE ORDER SUMMARY\n"
+    f"{_SUMMARY_RULE}\n"
+    "Action: {action} {quantity} contract(s)\n"
+    "Symbol: {symbol}\n"
+    "Strike: ${strike:.2f}\n"
+    "Expiration: {expiration}\n"
+    "Delta: {delta}\n"
+    "Order Type: {order_type}"
+)
+_LIMIT_PRICE_TEMPLATE = "\nLimit Price: ${:.2f}"
+_MARKET_TEMPLATE = "\nMarket: ${:.2f} / ${:.2f}"
+_EXIT_ORDERS_TEMPLATE = (
+    "\n\n"
+    "EXIT ORDERS:\n"
+    "  Sell at: ${sell:.2f}\n"
+    "  Take Profit: Buy back at ${take_profit:.2f} ({take_profit_pct}% profit)\n"
+    "  Stop Loss: Buy back at ${stop_loss:.2f} ({stop_loss_pct}% max loss)"
+)
+_SUMMARY_FOOTER = f"\n{_SUMMARY_RULE}"
+
 
 class IBKRClientProtocol(Protocol):
     """Protocol for IBKR client interface (allows mock injection)."""
@@ -103,6 +270,12 @@ class IBKRClientProtocol(Protocol):
         use_delayed: bool = True,
     ) -> OptionContract | None: ...
 
+    def find_puts_by_delta_batch(
+        self,
+        specs: list[tuple[float, int, str]],
+        use_delayed: bool = True,
+    ) -> list[OptionContract | None]: ...
+
     def execute_trade(
         self,
         contract: any,
@@ -120,6 +293,21 @@ class IBKRClientProtocol(Protocol):
 class PutSellingStrategy:
     """Strategy for selling puts on SPY with exit orders (TP/SL)."""
 
+    __slots__ = (
+        "client",
+        "strategy",
+        "exit_orders",
+        "_symbol",
+        "_quantity",
+        "_order_type",
+        "_target_dte",
+        "_target_delta",
+        "_use_aggressive_fill",
+        "_exits_enabled",
+        "_take_profit_factor",
+        "_stop_loss_factor",
+    )
+
     def __init__(
         self,
         client: IBKRClientProtocol,
@@ -137,6 +325,18 @@ class PutSellingStrategy:
         self.strategy = strategy_settings or StrategySettings()
         self.exit_orders = exit_settings or ExitOrderSettings()
 
+        # Settings are fixed for the strategy's lifetime; flatten the fields
+        # the order path reads on every attempt
+        self._symbol = self.strategy.symbol
+        self._quantity = self.strategy.quantity
+        self._order_type = self.strategy.order_type
+        self._target_dte = self.strategy.target_dte
+        self._target_delta = self.strategy.target_delta
+        self._use_aggressive_fill = self.strategy.use_aggressive_fill
+        self._exits_enabled = self.exit_orders.enabled
+        self._take_profit_factor = self.exit_orders.take_profit_factor
+        self._stop_loss_factor = self.exit_orders.stop_loss_factor
+
     def select_option(self) -> OptionContract | None:
         """Select the put option to sell based on strategy settings.
 
@@ -144,11 +344,25 @@ class PutSellingStrategy:
             Selected OptionContract or None if not found.
         """
         return self.client.find_put_by_delta(
-            target_delta=self.strategy.target_delta,
-            target_dte=self.strategy.target_dte,
-            symbol=self.strategy.symbol,
+            target_delta=self._target_delta,
+            target_dte=self._target_dte,
+            symbol=self._symbol,
         )
 
+    def select_options(
+        self,
+        specs: list[tuple[float, int, str]],
+    ) -> list[OptionContract | None]:
+        """Select puts for several targets in one batched lookup.
+
+        Args:
+            specs: (target_delta, target_dte, symbol) per requested put.
+
+        Returns:
+            One OptionContract (or None if not found) per spec, in order.
+        """
+        return self.client.find_puts_by_delta_batch(specs)
+
     def calculate_limit_price(self, option: OptionContract) -> float:
         """Calculate limit price for the sell order.
 
@@ -160,12 +374,14 @@ class PutSellingStrategy:
             option: The option contract to sell.
 
         Returns:
-            Mid price, rounded to 2 decimal places.
+            Mid price, rounded to the cent.
         """
         if option.mid is not None:
-            return round(option.mid, 2)
+            return _to_cents(option.mid) / 100
         elif option.bid is not None and option.ask is not None:
-            return round((option.bid + option.ask) / 2, 2)
+            # Quotes are whole cents, so average them as integers; round()
+            # then settles a half-cent mid exactly instead of by float error
+            return round((_to_cents(option.bid) + _to_cents(option.ask)) / 2) / 100
         elif option.bid is not None:
             # Fallback to bid if no ask available
             return option.bid
@@ -181,10 +397,10 @@ class PutSellingStrategy:
         Returns:
             ExitPrices with take profit and stop loss.
         """
-        return ExitPrices.calculate(
-            sell_price=sell_price,
-            take_profit_pct=self.exit_orders.take_profit_pct,
-            stop_loss_pct=self.exit_orders.stop_loss_pct,
+        return ExitPrices.from_factors(
+            sell_price,
+            take_profit_factor=self._take_profit_factor,
+            stop_loss_factor=self._stop_loss_factor,
         )
 
     def create_trade_order(self) -> TradeOrder | None:
@@ -192,6 +408,10 @@ class PutSellingStrategy:
 
         Returns:
             TradeOrder ready to execute, or None if no suitable option found.
+
+        Raises:
+            ValueError: If the option has no price to base the order or its
+                exit orders on.
         """
         # Select the option
         option = self.select_option()
@@ -199,31 +419,35 @@ class PutSellingStrategy:
             return None
 
         # Calculate prices
-        if self.strategy.order_type == "MKT":
+        if self._order_type == "MKT":
             limit_price = None
             # For exit price calculation, use mid price as estimate
-            sell_price = option.mid or option.bid or 0
+            sell_price = option.reference_price
         else:
             limit_price = self.calculate_limit_price(option)
             sell_price = limit_price
 
-        # Calculate exit prices if enabled
+        # Calculate exit prices if enabled (TradeOrder rejects exits without them)
         exit_prices = None
-        if self.exit_orders.enabled and sell_price > 0:
+        if self._exits_enabled and sell_price > 0:
             exit_prices = self.calculate_exit_prices(sell_price)
 
         return TradeOrder(
             option=option,
             action="SELL",
-            quantity=self.strategy.quantity,
-            order_type=self.strategy.order_type,
+            quantity=self._quantity,
+            order_type=self._order_type,
             limit_price=limit_price,
             exit_prices=exit_prices,
+            use_exit_orders=self._exits_enabled,
         )
 
     def execute_trade(self, order: TradeOrder, dry_run: bool = False) -> TradeResult:
         """Execute a trade order.
 
+        Orders are validated when created (see TradeOrder.__post_init__), so
+        this goes straight to the client.
+
         Args:
             order: The trade order to execute.
             dry_run: If True, don't actually place the order (for testing).
@@ -231,43 +455,14 @@ class PutSellingStrategy:
         Returns:
             TradeResult with execution details.
         """
-        if dry_run:
-            return TradeResult(
-                success=True,
-                order_id=None,
-                sell_order_id=None,
-                take_profit_order_id=None,
-                stop_loss_order_id=None,
-                message="DRY RUN - Order not placed",
-                timestamp=datetime.now(),
-            )
-
-        # Validate we have exit prices if exit orders are enabled
-        if self.exit_orders.enabled and order.exit_prices is None:
-            return TradeResult(
-                success=False,
-                order_id=None,
-                sell_order_id=None,
-                take_profit_order_id=None,
-                stop_loss_order_id=None,
-                message="Exit orders enabled but no exit prices calculated",
-                timestamp=datetime.now(),
-            )
+        # Results decided before reaching the broker share the entry time
+        started = time.time_ns()
 
-        # Validate limit price for LMT orders
-        if order.order_type == "LMT" and order.limit_price is None:
-            return TradeResult(
-                success=False,
-                order_id=None,
-                sell_order_id=None,
-                take_profit_order_id=None,
-                stop_loss_order_id=None,
-                message="Limit order requires limit price",
-                timestamp=datetime.now(),
-            )
+        if dry_run:
+            return replace(_DRY_RUN_RESULT, timestamp_ns=started)
 
         try:
-            if self.exit_orders.enabled and order.exit_prices:
+            if order.use_exit_orders:
                 # Place sell order, then exit orders (TP/SL) after fill
                 result = self.client.execute_trade(
                     contract=order.option.contract,
@@ -276,8 +471,10 @@ class PutSellingStrategy:
                     limit_price=order.limit_price or order.exit_prices.sell_price,
                     take_profit_price=order.exit_prices.take_profit_price,
                     stop_loss_price=order.exit_prices.stop_loss_price,
-                    use_aggressive_fill=self.strategy.use_aggressive_fill,
+                    use_aggressive_fill=self._use_aggressive_fill,
                 )
+                # The broker call waits for the fill, so stamp its outcome afresh
+                finished = time.time_ns()
 
                 if result.success:
                     # Extract fill price from sell trade if available
@@ -291,45 +488,34 @@ class PutSellingStrategy:
                         take_profit_order_id=result.take_profit_order_id,
                         stop_loss_order_id=result.stop_loss_order_id,
                         message="Order placed successfully with exit orders",
-                        timestamp=datetime.now(),
+                        timestamp_ns=finished,
                         fill_price=fill_price,
                         cancelled_orders=result.cancelled_orders,
                         commission=result.commission,
                         sell_trade=result.sell_trade,
                     )
                 else:
-                    return TradeResult(
-                        success=False,
-                        order_id=None,
+                    return replace(
+                        _FAILED_RESULT,
                         sell_order_id=result.sell_order_id,
-                        take_profit_order_id=None,
-                        stop_loss_order_id=None,
                         message=f"Order failed: {result.error_message}",
-                        timestamp=datetime.now(),
+                        timestamp_ns=finished,
                         cancelled_orders=result.cancelled_orders,
                     )
             else:
                 # Place single order (no exit orders)
                 # This would need place_single_order implementation
-                return TradeResult(
-                    success=False,
-                    order_id=None,
-                    sell_order_id=None,
-                    take_profit_order_id=None,
-                    stop_loss_order_id=None,
+                return replace(
+                    _FAILED_RESULT,
                     message="Single order (no exit orders) not yet implemented",
-                    timestamp=datetime.now(),
+                    timestamp_ns=started,
                 )
 
         except Exception as e:
-            return TradeResult(
-                success=False,
-                order_id=None,
-                sell_order_id=None,
-                take_profit_order_id=None,
-                stop_loss_order_id=None,
+            return replace(
+                _FAILED_RESULT,
                 message=f"Order execution error: {e}",
-                timestamp=datetime.now(),
+                timestamp_ns=time.time_ns(),
             )
 
     def run(
@@ -350,19 +536,12 @@ class PutSellingStrategy:
         Returns:
             Tuple of (TradeOrder, TradeResult). TradeOrder may be None if no option found.
         """
-        import logging
-        logger = logging.getLogger(__name__)
-
         # Ensure connected
         if not self.client.is_connected:
-            return None, TradeResult(
-                success=False,
-                order_id=None,
-                sell_order_id=None,
-                take_profit_order_id=None,
-                stop_loss_order_id=None,
+            return None, replace(
+                _FAILED_RESULT,
                 message="Client not connected",
-                timestamp=datetime.now(),
+                timestamp_ns=time.time_ns(),
             )
 
         # Each attempt is atomic: cancel orders -> execute -> restore on success or failure
@@ -370,18 +549,31 @@ class PutSellingStrategy:
         last_result = None
 
         for attempt in range(1, max_retries + 1):
-            logger.info(f"Trade attempt {attempt}/{max_retries}")
+            logger.info("Trade attempt %d/%d", attempt, max_retries)
 
             # Create trade order (selects option based on delta, calculates mid price)
-            order = self.create_trade_order()
+            try:
+                order = self.create_trade_order()
+            except ValueError as e:
+                logger.warning("Attempt %d: Could not build order: %s", attempt, e)
+                last_result = replace(_FAILED_RESULT, message=str(e), timestamp_ns=time.time_ns())
+                continue
+
             if order is None:
-                logger.warning(f"Attempt {attempt}: No suitable option found")
+                logger.warning("Attempt %d: No suitable option found", attempt)
                 if attempt < max_retries:
-                    logger.info(f"Retrying option selection...")
+                    logger.info("Retrying option selection...")
                 continue  # Try next attempt
 
             last_order = order
-            logger.info(f"Attempt {attempt}: Selected {order.option.symbol} {order.option.strike}P @ ${order.limit_price:.2f}")
+            # Market orders have no limit price; show the estimate they were planned on
+            logger.info(
+                "Attempt %d: Selected %s %sP @ $%.2f",
+                attempt,
+                order.option.symbol,
+                order.option.strike,
+                order.limit_price or order.option.reference_price,
+            )
 
             # Execute the trade (this cancels conflicting orders, places SELL, places TP/SL)
             result = self.execute_trade(order, dry_run=dry_run)
@@ -390,34 +582,31 @@ class PutSellingStrategy:
             if result.success:
                 # Success! Restore any cancelled orders from conflicting positions
                 if result.cancelled_orders:
-                    logger.info(f"Trade filled! Restoring {len(result.cancelled_orders)} cancelled order(s)...")
+                    logger.info("Trade filled! Restoring %d cancelled order(s)...", len(result.cancelled_orders))
                     self.client.restore_cancelled_orders(result.cancelled_orders)
                 return order, result
 
             # Failed - immediately restore cancelled orders to make attempt atomic
             if result.cancelled_orders:
-                logger.info(f"Attempt {attempt} failed. Restoring {len(result.cancelled_orders)} cancelled order(s)...")
+                logger.info("Attempt %d failed. Restoring %d cancelled order(s)...", attempt, len(result.cancelled_orders))
                 self.client.restore_cancelled_orders(result.cancelled_orders)
 
-            logger.warning(f"Attempt {attempt} failed: {result.message}")
+            logger.warning("Attempt %d failed: %s", attempt, result.message)
 
             if attempt < max_retries:
-                logger.info(f"Retrying with new contract selection...")
+                logger.info("Retrying with new contract selection...")
             else:
-                logger.error(f"All {max_retries} attempts failed")
+                logger.error("All %d attempts failed", max_retries)
 
         # All retries exhausted - no cancelled orders to restore (already restored after each attempt)
         if last_order is None:
-            logger.error(f"All {max_retries} attempts failed: No suitable option found")
+            logger.error("All %d attempts failed: No suitable option found", max_retries)
 
-        return last_order, TradeResult(
-            success=False,
-            order_id=None,
+        return last_order, replace(
+            _FAILED_RESULT,
             sell_order_id=last_result.sell_order_id if last_result else None,
-            take_profit_order_id=None,
-            stop_loss_order_id=None,
             message=f"Failed after {max_retries} attempts: {last_result.message if last_result else 'No suitable option found'}",
-            timestamp=datetime.now(),
+            timestamp_ns=time.time_ns(),
         )
 
     def describe_trade(self, order: TradeOrder) -> str:
@@ -429,34 +618,31 @@ class PutSellingStrategy:
         Returns:
             Formatted string describing the trade.
         """
-        lines = [
-            "=" * 60,
-            "TRADE ORDER SUMMARY",
-            "=" * 60,
-            f"Action: {order.action} {order.quantity} contract(s)",
-            f"Symbol: {order.option.symbol}",
-            f"Strike: ${order.option.strike:.2f}",
-            f"Expiration: {order.option.expiration}",
-            f"Delta: {order.option.delta:.4f}" if order.option.delta else "Delta: N/A",
-            f"Order Type: {order.order_type}",
-        ]
+        option = order.option
+        text = _SUMMARY_TEMPLATE.format(
+            action=order.action,
+            quantity=order.quantity,
+            symbol=option.symbol,
+            strike=option.strike,
+            expiration=option.expiration,
+            delta=f"{option.delta:.4f}" if option.delta else "N/A",
+            order_type=order.order_type,
+        )
 
         if order.limit_price:
-            lines.append(f"Limit Price: ${order.limit_price:.2f}")
-
-        if order.option.bid and order.option.ask:
-            lines.append(f"Market: ${order.option.bid:.2f} / ${order.option.ask:.2f}")
-
-        if order.exit_prices:
-            lines.extend([
-                "",
-                "EXIT ORDERS:",
-                f"  Sell at: ${order.exit_prices.sell_price:.2f}",
-                f"  Take Profit: Buy back at ${order.exit_prices.take_profit_price:.2f} "
-                f"({self.exit_orders.take_profit_pct}% profit)",
-                f"  Stop Loss: Buy back at ${order.exit_prices.stop_loss_price:.2f} "
-                f"({self.exit_orders.stop_loss_pct}% max loss)",
-            ])
-
-        lines.append("=" * 60)
-        return "\n".join(lines)
+            text += _LIMIT_PRICE_TEMPLATE.format(order.limit_price)
+
+        if option.bid and option.ask:
+            text += _MARKET_TEMPLATE.format(option.bid, option.ask)
+
+        exit_prices = order.exit_prices
+        if exit_prices:
+            text += _EXIT_ORDERS_TEMPLATE.format(
+                sell=exit_prices.sell_price,
+                take_profit=exit_prices.take_profit_price,
+                take_profit_pct=self.exit_orders.take_profit_pct,
+                stop_loss=exit_prices.stop_loss_price,
+                stop_loss_pct=self.exit_orders.stop_loss_pct,
+            )
+
+        return text + _SUMMARY_FOOTER
@@ -1,7 +1,9 @@
 """Tests for database operations."""
 
+import threading
 from datetime import date, datetime
 from decimal import Decimal
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -45,6 +47,20 @@ class TestDatabaseConnection:
         else:
             pytest.skip("Database not available")
 
+    def test_reconnect_closes_previous_connection(self, db_settings, monkeypatch):
+        """Reconnecting should close the connection being replaced."""
+        import psycopg2
+
+        old_conn, new_conn = MagicMock(closed=False), MagicMock(closed=False)
+        monkeypatch.setattr(psycopg2, "connect", MagicMock(return_value=new_conn))
+        database = Database(settings=db_settings)
+        database._conn = old_conn
+
+        assert database.connect()
+
+        old_conn.close.assert_called_once()
+        assert database._conn is new_conn
+
     def test_connection_string(self, db_settings):
         """Test connection string generation.
 
@@ -210,6 +226,89 @@ class TestPositionOperations:
         assert found.strike == Decimal("615.00")
 
 
+class TestTransaction:
+    """Test grouping operations into one transaction."""
+
+    def test_transaction_rolls_back_on_error(self, db):
+        """An error inside transaction() undoes every write in the block."""
+        position = Position(
+            symbol="SPY",
+            strike=Decimal("605.00"),
+            expiration=date(2026, 4, 17),
+            entry_price=Decimal("4.00"),
+            expected_tp_price=Decimal("1.60"),
+            expected_sl_price=Decimal("12.00"),
+        )
+
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                position_id = db.insert_position(position)
+                raise RuntimeError("abort")
+
+        assert db.get_position(position_id) is None
+
+    def test_failed_savepoint_keeps_earlier_writes(self, db):
+        """A failing savepoint block only undoes its own writes."""
+        position = Position(
+            symbol="SPY",
+            strike=Decimal("606.00"),
+            expiration=date(2026, 4, 17),
+            entry_price=Decimal("4.00"),
+            expected_tp_price=Decimal("1.60"),
+            expected_sl_price=Decimal("12.00"),
+        )
+
+        with db.transaction():
+            position_id = db.insert_position(position)
+            with pytest.raises(Exception):
+                with db.savepoint(), db.cursor() as cur:
+                    cur.execute("SELECT * FROM no_such_table")
+
+        assert db.get_position(position_id) is not None
+
+
+    def test_nested_savepoints_are_isolated(self, db):
+        """An inner savepoint failing keeps the outer savepoint's writes."""
+        position = Position(
+            symbol="SPY",
+            strike=Decimal("607.00"),
+            expiration=date(2026, 4, 17),
+            entry_price=Decimal("4.00"),
+            expected_tp_price=Decimal("1.60"),
+            expected_sl_price=Decimal("12.00"),
+        )
+
+        with db.transaction(), db.savepoint():
+            position_id = db.insert_position(position)
+            with pytest.raises(Exception):
+                with db.savepoint(), db.cursor() as cur:
+                    cur.execute("SELECT * FROM no_such_table")
+
+        assert db.get_position(position_id) is not None
+
+    def test_other_threads_wait_for_transaction(self, db_settings):
+        """Another thread's cursor must not join an open transaction."""
+        conn = MagicMock(closed=False)
+        database = Database(settings=db_settings)
+        database._conn = conn
+        events = []
+
+        def other_thread():
+            with database.cursor():
+                events.append("other")
+
+        with database.transaction():
+            worker = threading.Thread(target=other_thread)
+            worker.start()
+            worker.join(timeout=0.2)
+            events.append("commit")
+        worker.join()
+
+        assert events == ["commit", "other"]
+        # The other thread's block got its own commit after the transaction's
+        assert conn.commit.call_count == 2
+
+
 class TestSummaryViews:
     """Test summary queries."""
 
@@ -0,0 +1,252 @@
+"""Unit tests for the position monitor."""
+
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from ibkr_spy_puts.database import Position
+from ibkr_spy_puts.monitor import PositionMonitor
+
+
+class TestNextWakeTime:
+    """Test scheduling of monitor sync cycles."""
+
+    @pytest.fixture
+    def monitor(self):
+        """Create a monitor without connecting."""
+        return PositionMonitor()
+
+    def test_interval_during_market_hours(self, monitor):
+        """While the market is open, cycles run every interval."""
+        # Monday January 6, 2025, 11:00 ET
+        now = datetime(2025, 1, 6, 16, 0, tzinfo=timezone.utc)
+
+        assert monitor._next_wake_time(now, 5) == now + timedelta(minutes=5)
+
+    def test_sleeps_until_next_open_when_closed(self, monitor):
+        """Over the weekend, the next cycle is Monday's open."""
+        # Saturday January 4, 2025
+        now = datetime(2025, 1, 4, 15, 0, tzinfo=timezone.utc)
+
+        # Monday January 6, 2025, 9:30 ET
+        assert monitor._next_wake_time(now, 5) == datetime(2025, 1, 6, 14, 30, tzinfo=timezone.utc)
+
+    def test_polls_faster_near_trigger(self, monitor):
+        """A position close to its TP/SL shortens the interval during market hours."""
+        now = datetime(2025, 1, 6, 16, 0, tzinfo=timezone.utc)
+
+        assert monitor._next_wake_time(now, 5, near_trigger=True) == now + timedelta(seconds=15)
+
+    def test_near_trigger_uses_portfolio_marks(self, monitor):
+        """Portfolio marks near the stop loss count as near trigger."""
+        position = Position(
+            id=1, strike=Decimal("580"), expiration=date(2026, 4, 17),
+            expected_tp_price=Decimal("1.00"), expected_sl_price=Decimal("10.00"),
+        )
+        item = MagicMock()
+        item.contract.secType = "OPT"
+        item.contract.symbol = "SPY"
+        item.contract.strike = 580.0
+        item.contract.lastTradeDateOrContractMonth = "20260417"
+        monitor.client = MagicMock()
+        monitor.client.ib.portfolio.return_value = [item]
+        monitor._open_positions = {("SPY", 580, "20260417"): [position]}
+
+        item.marketPrice = 5.0
+        assert monitor._near_trigger() is False
+
+        item.marketPrice = 9.8
+        assert monitor._near_trigger() is True
+
+
+class TestPersistentConnections:
+    """Test connection reuse across monitor cycles."""
+
+    def test_live_connections_are_reused(self):
+        """Nothing reconnects while both sides are healthy."""
+        monitor = PositionMonitor()
+        monitor.db = MagicMock()
+        monitor.db.is_alive.return_value = True
+        monitor.client = MagicMock()
+        monitor.client.is_connected = True
+
+        assert monitor._ensure_connected() is True
+        monitor.db.connect.assert_not_called()
+        monitor.client.connect.assert_not_called()
+
+    def test_only_dropped_side_reconnects(self):
+        """A dropped TWS connection doesn't touch the database."""
+        monitor = PositionMonitor()
+        monitor.db = MagicMock()
+        monitor.db.is_alive.return_value = True
+        monitor.client = MagicMock()
+        monitor.client.is_connected = False
+        monitor.client.connect.return_value = True
+
+        assert monitor._ensure_connected() is True
+        monitor.client.connect.assert_called_once()
+        monitor.db.connect.assert_not_called()
+
+
+class TestFillIndex:
+    """Test the per-cycle fill index used to price closed positions."""
+
+    @staticmethod
+    def _fill(symbol, strike, expiration, time, price, sec_type="OPT"):
+        fill = MagicMock()
+        fill.contract.secType = sec_type
+        fill.contract.symbol = symbol
+        fill.contract.strike = strike
+        fill.contract.lastTradeDateOrContractMonth = expiration
+        fill.execution.time = time
+        fill.execution.avgPrice = price
+        return fill
+
+    def test_keeps_latest_fill_per_contract(self):
+        """Later fills for the same contract replace earlier ones."""
+        early = self._fill("SPY", 580.0, "20260417", datetime(2026, 1, 2, 15, 0), 1.10)
+        late = self._fill("SPY", 580.0, "20260417", datetime(2026, 1, 5, 15, 0), 0.55)
+
+        index = PositionMonitor._build_fill_index([late, early])
+
+        assert index == {("SPY", 580, "20260417"): late}
+
+    def test_skips_non_option_fills(self):
+        """Stock fills are not indexed."""
+        stock = self._fill("SPY", 0.0, "", datetime(2026, 1, 2, 15, 0), 600.0, sec_type="STK")
+
+        assert PositionMonitor._build_fill_index([stock]) == {}
+
+
+class TestUnchangedCycles:
+    """Test skipping syncs when IBKR reports no position changes."""
+
+    @pytest.fixture
+    def monitor(self):
+        """Monitor with mocked connections and an empty book."""
+        monitor = PositionMonitor()
+        monitor.db = MagicMock()
+        monitor.db.get_open_positions.return_value = []
+        monitor.db.get_open_positions_marker.return_value = (0, 0)
+        monitor.client = MagicMock()
+        monitor.client.positions_rev = 0
+        monitor.client.ib.positions.return_value = []
+        return monitor
+
+    def test_skips_when_positions_unchanged(self, monitor):
+        """A second sync with the same revision doesn't query again."""
+        monitor.sync_positions()
+        monitor.sync_positions()
+
+        monitor.db.get_open_positions.assert_called_once()
+
+    def test_resyncs_after_position_update(self, monitor):
+        """A position change since the last sync forces a full sync."""
+        position = MagicMock()
+        position.contract.secType = "OPT"
+        position.contract.conId = 1
+        position.position = -1
+
+        monitor.sync_positions()
+        monitor.client.positions_rev += 1
+        monitor.client.ib.positions.return_value = [position]
+        monitor.sync_positions()
+
+        assert monitor.db.get_open_positions.call_count == 2
+
+    def test_skips_replayed_positions(self, monitor):
+        """A revision bump with the same held contracts doesn't query the DB."""
+        monitor.sync_positions()
+        monitor.client.positions_rev += 1
+        monitor.sync_positions()
+
+        monitor.db.get_open_positions.assert_called_once()
+
+    def test_resyncs_after_database_change(self, monitor):
+        """A new open row in the database forces a full sync."""
+        monitor.sync_positions()
+        monitor.db.get_open_positions_marker.return_value = (1, 7)
+        monitor.sync_positions()
+
+        assert monitor.db.get_open_positions.call_count == 2
+
+
+class TestEventDrivenReconnect:
+    """Test the event-driven loop when a connection can't be made."""
+
+    def test_failed_connect_retries_with_short_backoff(self, monkeypatch):
+        """A failed reconnect retries after seconds, not the reconcile interval."""
+        from ibkr_spy_puts import monitor as monitor_module
+
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) == 2:
+                raise KeyboardInterrupt
+
+        monkeypatch.setattr(monitor_module.time, "sleep", fake_sleep)
+        monitor = PositionMonitor()
+        monkeypatch.setattr(monitor, "_ensure_connected", lambda: False)
+        monkeypatch.setattr(monitor, "disconnect", lambda: None)
+
+        monitor.run_event_driven(reconcile_minutes=60)
+
+        assert sleeps == [2 ** (monitor_module.RECONNECT_ATTEMPTS - 1)] * 2
+
+
+class TestPositionEvents:
+    """Test the positionEvent handler used by event-driven monitoring."""
+
+    @staticmethod
+    def _position(sec_type, quantity):
+        position = MagicMock()
+        position.contract.secType = sec_type
+        position.position = quantity
+        return position
+
+    def test_flat_option_position_flags_sync(self):
+        """An option position going to zero requests a sync."""
+        monitor = PositionMonitor()
+
+        monitor._on_position(self._position("OPT", 0))
+
+        assert monitor._positions_dirty is True
+
+    def test_other_updates_are_ignored(self):
+        """Open option positions and stock updates don't request a sync."""
+        monitor = PositionMonitor()
+
+        monitor._on_position(self._position("OPT", -1))
+        monitor._on_position(self._position("STK", 0))
+
+        assert monitor._positions_dirty is False
+
+
+class TestClosedPositionDetection:
+    """Test detecting database positions that are gone from IBKR."""
+
+    def test_only_missing_positions_are_closed(self):
+        """Positions still held in IBKR are left open."""
+        held = Position(id=1, strike=Decimal("580"), expiration=date(2026, 4, 17))
+        gone = Position(id=2, strike=Decimal("570"), expiration=date(2026, 4, 17))
+        ibkr_pos = MagicMock()
+        ibkr_pos.contract.secType = "OPT"
+        ibkr_pos.contract.symbol = "SPY"
+        ibkr_pos.contract.strike = 580.0
+        ibkr_pos.contract.lastTradeDateOrContractMonth = "20260417"
+
+        monitor = PositionMonitor()
+        monitor.db = MagicMock()
+        monitor.db.get_open_positions.return_value = [held, gone]
+        monitor.client = MagicMock()
+        monitor.client.ib.positions.return_value = [ibkr_pos]
+        monitor.client.ib.fills.return_value = []
+
+        stats = monitor.sync_positions()
+
+        assert stats["positions_closed"] == 1
+        monitor.db.close_position.assert_called_once()
+        assert monitor.db.close_position.call_args.args[0] == 2
@@ -0,0 +1,53 @@
+"""Unit tests for the built-in NYSE holiday rules."""
+
+from datetime import date
+
+import pytest
+
+from ibkr_spy_puts.nyse_holidays import FIRST_YEAR, compute_holidays
+from ibkr_spy_puts.scheduler import MarketCalendar
+
+
+class TestComputeHolidays:
+    """Test the pure-Python holiday rules."""
+
+    def test_2025_holidays(self):
+        """2025 should have the standard closures plus the day of mourning."""
+        assert compute_holidays(2025) == {
+            date(2025, 1, 1),
+            date(2025, 1, 9),  # President Carter's funeral
+            date(2025, 1, 20),
+            date(2025, 2, 17),
+            date(2025, 4, 18),
+            date(2025, 5, 26),
+            date(2025, 6, 19),
+            date(2025, 7, 4),
+            date(2025, 9, 1),
+            date(2025, 11, 27),
+            date(2025, 12, 25),
+        }
+
+    def test_saturday_new_year_not_observed(self):
+        """New Year's Day on a Saturday has no Friday closure."""
+        # January 1, 2022 was a Saturday
+        assert date(2021, 12, 31) not in compute_holidays(2021)
+        assert date(2022, 1, 1) not in compute_holidays(2022)
+
+    def test_weekend_holidays_observed(self):
+        """Saturday holidays move to Friday, Sunday holidays to Monday."""
+        # July 4, 2026 is a Saturday; June 19, 2022 was a Sunday
+        assert date(2026, 7, 3) in compute_holidays(2026)
+        assert date(2022, 6, 20) in compute_holidays(2022)
+
+    def test_before_first_year_raises(self):
+        """Years before the rules' coverage should raise ValueError."""
+        with pytest.raises(ValueError):
+            compute_holidays(FIRST_YEAR - 1)
+
+    def test_matches_market_calendar_library(self, monkeypatch):
+        """The rules should agree with pandas_market_calendars."""
+        monkeypatch.setenv("USE_MCAL", "1")
+        calendar = MarketCalendar(dont_use_cache=True)
+
+        for year in range(FIRST_YEAR, 2051):
+            assert compute_holidays(year) == calendar._get_holidays_for_year(year), year
@@ -3,6 +3,7 @@
 These tests run without TWS connection using fixture data.
 """
 
+from dataclasses import replace
 from datetime import date, timedelta
 from pathlib import Path
 
@@ -99,6 +100,18 @@ class TestOptionExpirations:
             # Longer DTE should have later expiration
             assert exp_30 <= exp_90 <= exp_180
 
+    def test_find_expiration_matches_linear_scan(self):
+        """Bisect lookup should match a linear closest-date scan."""
+        with MockIBKRClient(fixtures_dir=FIXTURES_DIR) as client:
+            expirations = client.get_option_expirations("SPY")
+            today = date.today()
+
+            for target_dte in range(-30, 1200, 7):
+                target_date = today + timedelta(days=target_dte)
+                expected = min(expirations, key=lambda x: abs((x - target_date).days))
+
+                assert client.find_expiration_by_dte(target_dte, "SPY") == expected
+
 
 class TestOptionChain:
     """Test option chain retrieval from fixtures."""
@@ -137,6 +150,34 @@ class TestOptionChain:
             for opt in options_with_delta:
                 assert opt.delta < 0, f"Put delta should be negative, got {opt.delta}"
 
+    def test_option_chain_partitioned_by_right(self):
+        """Chains are served per right; fixtures only contain puts."""
+        with MockIBKRClient(fixtures_dir=FIXTURES_DIR) as client:
+            expiration = client.find_expiration_by_dte(90, "SPY")
+            puts = client.get_option_chain_with_greeks("SPY", expiration, "P")
+            calls = client.get_option_chain_with_greeks("SPY", expiration, "C")
+
+            assert len(puts) == len(client._data["option_chain"])
+            assert all(opt.right == "P" for opt in puts)
+            assert calls == []
+
+    def test_option_chain_uses_requested_expiration(self):
+        """A non-fixture expiration is served with contracts for that date."""
+        with MockIBKRClient(fixtures_dir=FIXTURES_DIR) as client:
+            requested = date(2030, 1, 18)
+            chain = client.get_option_chain_with_greeks("SPY", requested, "P")
+            fixture_exp = client.find_expiration_by_dte(90, "SPY")
+            fixture_chain = client.get_option_chain_with_greeks("SPY", fixture_exp, "P")
+
+            assert len(chain) > 0
+            assert all(
+                opt.contract.lastTradeDateOrContractMonth == "20300118" for opt in chain
+            )
+            assert all(
+                opt.contract.lastTradeDateOrContractMonth == fixture_exp.strftime("%Y%m%d")
+                for opt in fixture_chain
+            )
+
     def test_option_chain_has_prices(self):
         """Options should have bid/ask prices."""
         with MockIBKRClient(fixtures_dir=FIXTURES_DIR) as client:
@@ -149,6 +190,19 @@ class TestOptionChain:
                     assert opt.ask > 0
                     assert opt.ask >= opt.bid  # Ask should be >= bid
 
+    def test_reference_price_falls_back_from_mid_to_bid(self):
+        """reference_price is the mid, else the bid, else zero."""
+        with MockIBKRClient(fixtures_dir=FIXTURES_DIR) as client:
+            expiration = client.find_expiration_by_dte(90, "SPY")
+            opt = next(
+                o for o in client.get_option_chain_with_greeks("SPY", expiration, "P")
+                if o.mid and o.bid
+            )
+
+        assert opt.reference_price == opt.mid
+        assert replace(opt, mid=None).reference_price == opt.bid
+        assert replace(opt, mid=None, bid=None).reference_price == 0.0
+
 
 class TestFindPutByDelta:
     """Test put selection by delta."""
@@ -198,6 +252,61 @@ class TestFindPutByDelta:
             # Higher delta (closer to ATM) should have higher strike
             assert put_10.strike <= put_20.strike <= put_30.strike
 
+    def test_find_put_matches_full_chain_scan(self):
+        """Precomputed delta search should match a scan of the full chain."""
+        with MockIBKRClient(fixtures_dir=FIXTURES_DIR) as client:
+            expiration = client.find_expiration_by_dte(90, "SPY")
+            chain = client.get_option_chain_with_greeks("SPY", expiration, "P")
+            options_with_delta = [opt for opt in chain if opt.delta is not None]
+
+            for target_delta in (-0.05, -0.15, -0.25, -0.40):
+                expected = min(options_with_delta, key=lambda x: abs(x.delta - target_delta))
+                put = client.find_put_by_delta(target_delta=target_delta, target_dte=90)
+
+                assert put is not None
+                assert put.strike == expected.strike
+                assert put.delta == expected.delta
+
+    def test_batch_matches_single_lookups(self):
+        """Batched lookups return what one call per spec would, in order."""
+        specs = [(-0.15, 90, "SPY"), (-0.25, 90, "SPY"), (-0.05, 45, "SPY")]
+
+        with MockIBKRClient(fixtures_dir=FIXTURES_DIR) as client:
+            puts = client.find_puts_by_delta_batch(specs)
+
+            assert puts == [
+                client.find_put_by_delta(target_delta=delta, target_dte=dte, symbol=symbol)
+                for delta, dte, symbol in specs
+            ]
+
+    def test_ibkr_batch_shares_chains_and_one_wait(self):
+        """IBKRClient subscribes each expiration once and waits for greeks once."""
+        from unittest.mock import MagicMock, patch
+
+        from ibkr_spy_puts.ibkr_client import IBKRClient
+
+        with MockIBKRClient(fixtures_dir=FIXTURES_DIR) as mock:
+            expiration = mock.find_expiration_by_dte(90, "SPY")
+            chain = mock.get_option_chain_with_greeks("SPY", expiration, "P")
+
+        client = IBKRClient()
+        client.ib = MagicMock()
+        client.ib.isConnected.return_value = True
+        with (
+            patch.object(client, "find_expiration_by_dte", return_value=expiration),
+            patch.object(client, "_request_option_chain", return_value=[object()]) as request,
+            patch.object(client, "_wait_for_greeks") as wait,
+            patch.object(client, "_collect_option_chain", return_value=chain),
+        ):
+            puts = client.find_puts_by_delta_batch([(-0.15, 90, "SPY"), (-0.25, 85, "SPY")])
+
+        request.assert_called_once_with("SPY", expiration, "P")
+        wait.assert_called_once()
+        assert [put.delta for put in puts] == [
+            min((o for o in chain if o.delta is not None), key=lambda o: abs(o.delta - target)).delta
+            for target in (-0.15, -0.25)
+        ]
+
 
 class TestExitPriceCalculation:
     """Test exit order price calculations."""
@@ -253,3 +362,115 @@ class TestAccountSummary:
             assert isinstance(summary, dict)
             assert len(summary) > 0
             assert "NetLiquidation" in summary or "BuyingPower" in summary
+
+
+class TestFixtureCaching:
+    """Test that fixtures are loaded once per directory."""
+
+    def test_clients_share_read_only_fixture_data(self):
+        """Clients for the same directory should share one read-only mapping."""
+        first = MockIBKRClient(fixtures_dir=FIXTURES_DIR)
+        second = MockIBKRClient(fixtures_dir=str(FIXTURES_DIR))
+
+        assert first._data is second._data
+        with pytest.raises(TypeError):
+            first._data["spy_price"] = 1.0
+
+
+class TestIndividualFixtures:
+    """Test the legacy individual fixture files."""
+
+    def test_individual_fixtures_load_with_deprecation_warning(self, tmp_path):
+        """Split fixtures still load but warn that market_data.json is canonical."""
+        import shutil
+
+        for name in ("spy_price.json", "spy_expirations.json", "spy_option_chain.json"):
+            shutil.copy(FIXTURES_DIR / name, tmp_path / name)
+
+        with pytest.warns(DeprecationWarning, match="market_data.json"):
+            client = MockIBKRClient(fixtures_dir=tmp_path)
+
+        assert client.get_spy_price() is not None
+        assert len(client.get_option_expirations()) > 0
+        assert client.find_put_by_delta(target_delta=-0.15, target_dte=90) is not None
+
+
+class TestColumnarFixtures:
+    """Test loading the option chain from JSON-lines fixtures."""
+
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
+    def test_jsonl_chain_preferred_over_json(self, tmp_path):
+        """JSON-lines chain should be loaded in place of the JSON chain."""
+        import json
+
+        (tmp_path / "spy_price.json").write_text(json.dumps({"price": 600.0}))
+        rows = [
+            {"symbol": "SPY", "strike": strike, "expiration": "2026-04-17", "right": "P",
+             "delta": delta, "bid": 4.0, "ask": 4.2, "mid": 4.1}
+            for strike, delta in ((580.0, -0.12), (590.0, -0.18))
+        ]
+        (tmp_path / "spy_option_chain.jsonl").write_text(
+            "\n".join(json.dumps(row) for row in rows) + "\n"
+        )
+
+        client = MockIBKRClient(fixtures_dir=tmp_path)
+        chain = client.get_option_chain_with_greeks("SPY", date(2026, 4, 17), "P")
+
+        assert [opt.strike for opt in chain] == [580.0, 590.0]
+        assert all(opt.expiration == date(2026, 4, 17) for opt in chain)
+
+
+class TestTTLCache:
+    """Test TTL caching of market data at the client boundary."""
+
+    def test_cached_within_ttl(self):
+        """Repeated calls should reuse the cached result until it expires."""
+        client = MockIBKRClient(fixtures_dir=FIXTURES_DIR)
+
+        first = client.get_spy_price()
+        client._data = {"spy_price": 1.0}
+
+        assert client.get_spy_price() == first
+
+    def test_use_cache_false_bypasses_cache(self):
+        """use_cache=False should always call through to the data source."""
+        client = MockIBKRClient(fixtures_dir=FIXTURES_DIR)
+
+        client.get_spy_price()
+        client._data = {"spy_price": 1.0}
+
+        assert client.get_spy_price(use_cache=False) == 1.0
+
+    def test_entries_expire_after_ttl(self, monkeypatch):
+        """Results older than the TTL should be fetched again."""
+        import time
+
+        from ibkr_spy_puts.ibkr_client import SPY_PRICE_TTL
+
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        client = MockIBKRClient(fixtures_dir=FIXTURES_DIR)
+        client.get_spy_price()
+        client._data = {"spy_price": 1.0}
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + SPY_PRICE_TTL + 1)
+
+        assert client.get_spy_price() == 1.0
+
+    def test_cache_is_per_instance(self):
+        """Each client should keep its own cache."""
+        first = MockIBKRClient(fixtures_dir=FIXTURES_DIR)
+        second = MockIBKRClient(fixtures_dir=FIXTURES_DIR)
+
+        first.get_spy_price()
+        second._data = {"spy_price": 1.0}
+
+        assert second.get_spy_price() == 1.0
+
+    def test_live_client_does_not_cache_quotes(self):
+        """IBKRClient must reprice from fresh quotes on every call."""
+        from ibkr_spy_puts.ibkr_client import IBKRClient
+
+        assert not hasattr(IBKRClient.get_spy_price, "__wrapped__")
+        assert not hasattr(IBKRClient.get_option_chain_with_greeks, "__wrapped__")
+        assert hasattr(IBKRClient.get_option_expirations, "__wrapped__")
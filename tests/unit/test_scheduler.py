@@ -1,6 +1,8 @@
 """Unit tests for scheduler and market calendar."""
 
-from datetime import date, timedelta
+import subprocess
+import sys
+from datetime import date, datetime, timedelta, timezone
 
 import pytest
 
@@ -13,7 +15,7 @@ class TestMarketCalendar:
     @pytest.fixture
     def calendar(self):
         """Create a market calendar instance."""
-        return MarketCalendar()
+        return MarketCalendar(dont_use_cache=True)
 
     def test_weekday_is_usually_trading_day(self, calendar):
         """Weekdays that aren't holidays should be trading days."""
@@ -61,6 +63,13 @@ class TestMarketCalendar:
 
         assert next_day == monday
 
+    def test_next_trading_day_skips_holiday_weekend(self, calendar):
+        """Good Friday plus the weekend should roll to Monday."""
+        # April 18, 2025 was Good Friday
+        assert calendar.next_trading_day(date(2025, 4, 18)) == date(2025, 4, 21)
+        # Saturday December 27, 2025 after Christmas rolls to Monday
+        assert calendar.next_trading_day(date(2025, 12, 27)) == date(2025, 12, 29)
+
     def test_get_holidays_returns_list(self, calendar):
         """get_holidays should return a list of dates."""
         holidays = calendar.get_holidays(2025)
@@ -97,12 +106,82 @@ class TestMarketCalendar:
 
         assert holidays1 == holidays2
 
+    def test_holidays_match_schedule(self, calendar):
+        """Weekday holidays should be exactly the weekdays without a session."""
+        schedule = calendar.nyse.schedule(start_date="2025-01-01", end_date="2025-12-31")
+        sessions = {d.date() for d in schedule.index}
+        day = date(2025, 1, 1)
+        while day.year == 2025:
+            if day.weekday() < 5:
+                assert calendar.is_trading_day(day) is (day in sessions)
+            day += timedelta(days=1)
+        # National Day of Mourning closure, not a regular holiday rule
+        assert date(2025, 1, 9) in calendar.get_holidays(2025)
+
+    def test_next_trading_day_across_year_end(self, calendar):
+        """Dec 31 after the last session should roll into January."""
+        # Saturday January 1, 2028 and Sunday the 2nd; Friday Dec 31, 2027 trades
+        assert calendar.next_trading_day(date(2027, 12, 31)) == date(2027, 12, 31)
+        assert calendar.next_trading_day(date(2028, 1, 1)) == date(2028, 1, 3)
+        # Saturday December 30, 2028 rolls past New Year's Day (Monday)
+        assert calendar.next_trading_day(date(2028, 12, 30)) == date(2029, 1, 2)
+
+    def test_upcoming_trading_days(self, calendar):
+        """Upcoming days should skip weekends and holidays across year end."""
+        days = calendar.upcoming_trading_days(4, date(2025, 12, 24))
+
+        # Christmas, the weekend and New Year's Day are skipped
+        assert days == [
+            date(2025, 12, 24),
+            date(2025, 12, 26),
+            date(2025, 12, 29),
+            date(2025, 12, 30),
+        ]
+        assert calendar.upcoming_trading_days(2, date(2025, 12, 31)) == [
+            date(2025, 12, 31),
+            date(2026, 1, 2),
+        ]
+
+    def test_injected_clock_is_default_date(self):
+        """Defaults should come from the injected clock."""
+        saturday = date(2025, 1, 4)
+        calendar = MarketCalendar(dont_use_cache=True, today=lambda: saturday)
+
+        assert calendar.is_trading_day() is False
+        assert calendar.next_trading_day() == date(2025, 1, 6)
+
     def test_today_check_works(self, calendar):
         """is_trading_day with no argument should check today."""
         # This just verifies no exception is raised
         result = calendar.is_trading_day()
         assert isinstance(result, bool)
 
+    def test_next_market_open_skips_weekend(self, calendar):
+        """Next open after Friday's close should be Monday 9:30 ET."""
+        # Friday January 3, 2025, 17:00 ET (22:00 UTC)
+        friday_evening = datetime(2025, 1, 3, 22, 0, tzinfo=timezone.utc)
+
+        next_open = calendar.next_market_open(friday_evening)
+
+        # Monday January 6, 2025, 9:30 ET (14:30 UTC)
+        assert next_open == datetime(2025, 1, 6, 14, 30, tzinfo=timezone.utc)
+
+    def test_is_market_open_respects_early_close(self, calendar):
+        """The day after Thanksgiving closes at 1:00 PM ET."""
+        # November 29, 2024: 12:00 ET open, 14:00 ET closed
+        assert calendar.is_market_open(datetime(2024, 11, 29, 17, 0, tzinfo=timezone.utc))
+        assert not calendar.is_market_open(datetime(2024, 11, 29, 19, 0, tzinfo=timezone.utc))
+
+    def test_sessions_precomputed_once(self, calendar):
+        """Repeated lookups within the window should reuse the session list."""
+        calendar.next_market_open()
+        opens = calendar._session_opens
+
+        calendar.is_market_open()
+        calendar.next_market_open()
+
+        assert calendar._session_opens is opens
+
 
 class TestSchedulerConfig:
     """Test scheduler configuration."""
@@ -130,6 +209,162 @@ class TestSchedulerConfig:
         assert settings.timezone == "US/Eastern"
 
 
+class TestTradeSchedule:
+    """Test per-trading-day trade jobs."""
+
+    @pytest.fixture
+    def trading_scheduler(self, monkeypatch):
+        """Create a scheduler without signal handlers or an on-disk cache."""
+        from ibkr_spy_puts import scheduler as scheduler_module
+
+        monkeypatch.setattr(
+            scheduler_module, "MarketCalendar",
+            lambda: MarketCalendar(dont_use_cache=True),
+        )
+        monkeypatch.setattr(
+            scheduler_module.TradingScheduler, "_setup_signal_handlers", lambda self: None
+        )
+        return scheduler_module.TradingScheduler(trade_func=lambda: None)
+
+    def test_prefetch_loads_next_year(self, trading_scheduler):
+        """The December prefetch job should load next year's holidays."""
+        calendar = trading_scheduler.calendar
+        year = calendar.today().year
+        calendar._holidays.clear()
+
+        trading_scheduler._prefetch_holidays()
+
+        assert year + 1 in calendar._holidays
+
+    def test_jobs_only_on_trading_days(self, trading_scheduler):
+        """Every trade job should fall on a trading day, none on holidays."""
+        from ibkr_spy_puts.scheduler import TRADE_DAYS_AHEAD
+
+        trading_scheduler._schedule_trading_days()
+        days = [
+            date.fromisoformat(job.id.removeprefix("trade-"))
+            for job in trading_scheduler.scheduler.get_jobs()
+            if job.id.startswith("trade-")
+        ]
+
+        # Today's job is skipped once its time has passed
+        assert TRADE_DAYS_AHEAD - 1 <= len(days) <= TRADE_DAYS_AHEAD
+        assert all(trading_scheduler.calendar.is_trading_day(d) for d in days)
+        assert days == sorted(days)
+
+    def test_trading_day_checked_once_per_day(self, trading_scheduler, monkeypatch):
+        """Trade and snapshot on the same day should share one calendar lookup."""
+        calls = []
+        is_trading_day = trading_scheduler.calendar.is_trading_day
+        monkeypatch.setattr(
+            trading_scheduler.calendar, "is_trading_day",
+            lambda d: calls.append(d) or is_trading_day(d),
+        )
+        trading_scheduler.snapshot_func = lambda: None
+
+        trading_scheduler._execute_trade()
+        trading_scheduler._execute_snapshot()
+
+        assert len(calls) == 1
+
+    def test_shutdown_waits_for_running_job(self, trading_scheduler, monkeypatch):
+        """A requested shutdown should stop only after the running job ends."""
+        from types import SimpleNamespace
+
+        from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_SUBMITTED
+
+        stops = []
+        monkeypatch.setattr(trading_scheduler, "stop", lambda: stops.append(True))
+
+        trading_scheduler._on_job_event(SimpleNamespace(code=EVENT_JOB_SUBMITTED))
+        trading_scheduler._shutdown_requested.set()
+        assert stops == []
+
+        trading_scheduler._on_job_event(SimpleNamespace(code=EVENT_JOB_EXECUTED))
+        assert stops == [True]
+
+    def test_refill_does_not_duplicate(self, trading_scheduler):
+        """Re-running the refill should replace, not add, existing days."""
+        from apscheduler.schedulers.background import BackgroundScheduler
+
+        # Jobs are only deduplicated by a running scheduler's job store
+        trading_scheduler.scheduler = BackgroundScheduler(timezone=trading_scheduler._tz)
+        trading_scheduler.scheduler.start(paused=True)
+        try:
+            trading_scheduler._schedule_trading_days()
+            count = len(trading_scheduler.scheduler.get_jobs())
+            trading_scheduler._schedule_trading_days()
+
+            assert len(trading_scheduler.scheduler.get_jobs()) == count
+        finally:
+            trading_scheduler.scheduler.shutdown(wait=False)
+
+
+class TestParseTradeTime:
+    """Test trade time parsing."""
+
+    def test_hour_and_minute(self):
+        """HH:MM should parse to (hour, minute)."""
+        from ibkr_spy_puts.scheduler import TradingScheduler
+
+        assert TradingScheduler._parse_trade_time("09:30") == (9, 30)
+        assert TradingScheduler._parse_trade_time("15") == (15, 0)
+
+    @pytest.mark.parametrize("value", ["25:00", "09:60", "9:30:00", "abc"])
+    def test_invalid_time_raises(self, value):
+        """Malformed or out-of-range times should raise ValueError."""
+        from ibkr_spy_puts.scheduler import TradingScheduler
+
+        with pytest.raises(ValueError):
+            TradingScheduler._parse_trade_time(value)
+
+
+class TestSnapshotDecimal:
+    """Test snapshot total conversion."""
+
+    def test_quantizes_to_column_scale(self):
+        """Float totals should round to the column's decimal places."""
+        from decimal import Decimal
+
+        from ibkr_spy_puts.scheduler import CENTS, SIX_PLACES, _snapshot_decimal
+
+        assert _snapshot_decimal(1234.5678, CENTS) == Decimal("1234.57")
+        assert _snapshot_decimal(-0.00123456789, SIX_PLACES) == Decimal("-0.001235")
+
+    def test_zero_is_none(self):
+        """A zero total should be stored as NULL."""
+        from ibkr_spy_puts.scheduler import CENTS, _snapshot_decimal
+
+        assert _snapshot_decimal(0.0, CENTS) is None
+
+
+class TestImportCost:
+    """Test that heavy dependencies are deferred."""
+
+    def test_import_does_not_load_calendar_or_apscheduler(self):
+        """Importing the module should not pull in pandas or APScheduler."""
+        code = (
+            "import sys, ibkr_spy_puts.scheduler; "
+            "print(sorted(m for m in ('pandas_market_calendars', 'apscheduler') "
+            "if m in sys.modules))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "[]"
+
+    def test_import_leaves_logging_unconfigured(self):
+        """Importing the module should not install root log handlers."""
+        code = (
+            "import logging, ibkr_spy_puts.scheduler; "
+            "print(len(logging.getLogger().handlers))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "0"
+
+
 class TestTradeFunction:
     """Test the trade function creation."""
 
@@ -149,3 +384,81 @@ class TestTradeFunction:
 
         # Should not raise
         trade_func()
+
+    def test_shared_database_stays_open(self):
+        """A shared database should be reused and left connected after a run."""
+        from unittest.mock import MagicMock
+
+        from ibkr_spy_puts.scheduler import create_trade_function
+
+        db = MagicMock()
+        db.is_alive.return_value = True
+        trade_func = create_trade_function(use_mock=True, dry_run=True, db=db)
+
+        trade_func()
+
+        db.connect.assert_not_called()
+        db.disconnect.assert_not_called()
+
+    def test_trade_function_reuses_event_loop(self):
+        """Each run, even from a new thread, should get the same event loop."""
+        import asyncio
+        import threading
+
+        from ibkr_spy_puts.scheduler import create_trade_function
+
+        trade_func = create_trade_function(use_mock=True, dry_run=True)
+        loops = []
+
+        def run():
+            trade_func()
+            loops.append(asyncio.get_event_loop())
+
+        for _ in range(2):
+            worker = threading.Thread(target=run)
+            worker.start()
+            worker.join()
+
+        assert len(loops) == 2
+        assert loops[0] is loops[1]
+
+
+class TestHolidayCache:
+    """Test the on-disk holiday cache."""
+
+    def test_holidays_persist_across_instances(self, tmp_path):
+        """A second calendar should read holidays from the cache file."""
+        cache_path = tmp_path / "nyse_holidays.pkl"
+        first = MarketCalendar(cache_path=cache_path)
+        holidays = first.get_holidays(2025)
+        assert cache_path.exists()
+
+        second = MarketCalendar(cache_path=cache_path)
+        assert second.get_holidays(2025) == holidays
+        # Served from the file without loading the calendar library
+        assert "nyse" not in second.__dict__
+
+    def test_other_cache_version_is_ignored(self, tmp_path):
+        """A cache file from another layout version should be recomputed."""
+        import pickle
+
+        cache_path = tmp_path / "nyse_holidays.pkl"
+        cache_path.write_bytes(pickle.dumps({2025: frozenset()}))
+
+        calendar = MarketCalendar(cache_path=cache_path)
+        assert date(2025, 12, 25) in calendar.get_holidays(2025)
+
+    def test_corrupt_cache_is_ignored(self, tmp_path):
+        """An unreadable cache file should fall back to computing holidays."""
+        cache_path = tmp_path / "nyse_holidays.pkl"
+        cache_path.write_bytes(b"not a pickle")
+
+        calendar = MarketCalendar(cache_path=cache_path)
+        assert date(2025, 12, 25) in calendar.get_holidays(2025)
+
+    def test_dont_use_cache_skips_file(self, tmp_path):
+        """dont_use_cache should neither read nor write the cache file."""
+        cache_path = tmp_path / "nyse_holidays.pkl"
+        calendar = MarketCalendar(cache_path=cache_path, dont_use_cache=True)
+        calendar.get_holidays(2025)
+        assert not cache_path.exists()
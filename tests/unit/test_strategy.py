@@ -3,6 +3,7 @@
 These tests run without TWS connection using fixture data.
 """
 
+import dataclasses
 from datetime import date
 from pathlib import Path
 
@@ -59,6 +60,52 @@ class TestExitPrices:
         assert prices.take_profit_price == pytest.approx(0.20)
         assert prices.stop_loss_price == pytest.approx(1.50)
 
+    def test_strategy_factors_match_calculate(self):
+        """Test the strategy's precomputed multipliers give calculate()'s prices."""
+        exit_settings = ExitOrderSettings(take_profit_pct=65.0, stop_loss_pct=175.0)
+        strategy = PutSellingStrategy(MockIBKRClient(), exit_settings=exit_settings)
+
+        assert exit_settings.take_profit_factor == pytest.approx(0.35)
+        assert exit_settings.stop_loss_factor == pytest.approx(2.75)
+        for sell_price in (0.37, 1.00, 4.85):
+            assert strategy.calculate_exit_prices(sell_price) == ExitPrices.calculate(
+                sell_price=sell_price,
+                take_profit_pct=65.0,
+                stop_loss_pct=175.0,
+            )
+
+    def test_factors_follow_updated_percentages(self):
+        """Test the factors reflect a changed percentage, not a stale value."""
+        exit_settings = ExitOrderSettings(take_profit_pct=60.0, stop_loss_pct=200.0)
+        assert exit_settings.take_profit_factor == pytest.approx(0.4)
+
+        exit_settings.take_profit_pct = 50.0
+        exit_settings.stop_loss_pct = 100.0
+
+        assert exit_settings.take_profit_factor == pytest.approx(0.5)
+        assert exit_settings.stop_loss_factor == pytest.approx(2.0)
+
+    def test_calculate_batch_matches_scalar(self):
+        """Test the vectorized sweep broadcasts to the scalar results."""
+        np = pytest.importorskip("numpy")
+        sell_prices = [0.50, 1.00, 2.35]
+        tp_pcts = [50.0, 60.0]
+        sl_pcts = [100.0, 150.0, 200.0]
+
+        tp, sl = ExitPrices.calculate_batch(
+            np.array(sell_prices)[:, None, None],
+            np.array(tp_pcts)[None, :, None],
+            np.array(sl_pcts)[None, None, :],
+        )
+
+        assert tp.shape == sl.shape == (3, 2, 3)
+        for i, sell in enumerate(sell_prices):
+            for j, tp_pct in enumerate(tp_pcts):
+                for k, sl_pct in enumerate(sl_pcts):
+                    prices = ExitPrices.calculate(sell, tp_pct, sl_pct)
+                    assert tp[i, j, k] == pytest.approx(prices.take_profit_price)
+                    assert sl[i, j, k] == pytest.approx(prices.stop_loss_price)
+
 
 class TestPutSellingStrategy:
     """Test the put selling strategy."""
@@ -112,6 +159,17 @@ class TestPutSellingStrategy:
             assert option.delta is not None
             assert -0.30 <= option.delta <= -0.05
 
+    def test_select_options(self):
+        """Test batched selection returns one option per spec."""
+        with MockIBKRClient(fixtures_dir=FIXTURES_DIR) as client:
+            strategy = PutSellingStrategy(client)
+
+            options = strategy.select_options([(-0.15, 90, "SPY"), (-0.25, 90, "SPY")])
+
+            assert len(options) == 2
+            assert options[0] == strategy.select_option()
+            assert options[1].delta < options[0].delta
+
     def test_calculate_limit_price(self):
         """Test limit price calculation."""
         with MockIBKRClient(fixtures_dir=FIXTURES_DIR) as client:
@@ -124,6 +182,25 @@ class TestPutSellingStrategy:
             # Limit price should be mid price (no offset, fill speed controlled by Adaptive algo)
             assert limit_price == pytest.approx(option.mid, rel=0.01)
 
+    def test_calculate_limit_price_half_cent_mid(self):
+        """Test a half-cent bid/ask mid rounds like round(), not by float error."""
+        with MockIBKRClient(fixtures_dir=FIXTURES_DIR) as client:
+            strategy = PutSellingStrategy(client)
+            option = strategy.select_option()
+
+            for bid, ask, expected in ((0.05, 0.10, 0.08), (1.10, 1.15, 1.12), (5.58, 5.61, 5.60)):
+                quoted = dataclasses.replace(option, bid=bid, ask=ask, mid=None)
+                assert strategy.calculate_limit_price(quoted) == expected
+
+    def test_calculate_limit_price_prefers_mid(self):
+        """Test the quoted mid wins over the bid/ask average."""
+        with MockIBKRClient(fixtures_dir=FIXTURES_DIR) as client:
+            strategy = PutSellingStrategy(client)
+            option = strategy.select_option()
+
+            quoted = dataclasses.replace(option, bid=1.90, ask=2.20, mid=2.00)
+            assert strategy.calculate_limit_price(quoted) == 2.00
+
     def test_calculate_exit_prices(self):
         """Test exit price calculation."""
         with MockIBKRClient(fixtures_dir=FIXTURES_DIR) as client:
@@ -134,6 +211,7 @@ class TestPutSellingStrategy:
             assert exit_prices.sell_price == 1.00
             assert exit_prices.take_profit_price == pytest.approx(0.40)
             assert exit_prices.stop_loss_price == pytest.approx(3.00)
+            assert (exit_prices.take_profit_cents, exit_prices.stop_loss_cents) == (40, 300)
 
     def test_create_trade_order(self):
         """Test creating a trade order."""
@@ -177,6 +255,55 @@ class TestPutSellingStrategy:
             assert order is not None
             assert order.exit_prices is None
 
+    def test_limit_order_requires_limit_price(self):
+        """Test a limit order can't be built without a limit price."""
+        with MockIBKRClient(fixtures_dir=FIXTURES_DIR) as client:
+            option = PutSellingStrategy(client).select_option()
+
+        with pytest.raises(ValueError, match="limit price"):
+            TradeOrder(
+                option=option,
+                action="SELL",
+                quantity=1,
+                order_type="LMT",
+                limit_price=None,
+                exit_prices=None,
+            )
+
+    def test_exit_orders_require_exit_prices(self):
+        """Test an order can't request exit orders without exit prices."""
+        with MockIBKRClient(fixtures_dir=FIXTURES_DIR) as client:
+            option = PutSellingStrategy(client).select_option()
+
+        with pytest.raises(ValueError, match="no exit prices"):
+            TradeOrder(
+                option=option,
+                action="SELL",
+                quantity=1,
+                order_type="MKT",
+                limit_price=None,
+                exit_prices=None,
+                use_exit_orders=True,
+            )
+
+    def test_create_trade_order_unpriced_option_with_exits(self, monkeypatch):
+        """Test exit orders can't be planned off an option with no price."""
+        custom = StrategySettings(order_type="MKT")
+
+        with MockIBKRClient(fixtures_dir=FIXTURES_DIR) as client:
+            strategy = PutSellingStrategy(client, strategy_settings=custom)
+            unpriced = dataclasses.replace(strategy.select_option(), bid=None, ask=None, mid=None)
+            monkeypatch.setattr(PutSellingStrategy, "select_option", lambda self: unpriced)
+
+            with pytest.raises(ValueError, match="no exit prices"):
+                strategy.create_trade_order()
+
+            order, result = strategy.run(max_retries=2)
+
+            assert order is None
+            assert result.success is False
+            assert "no exit prices" in result.message
+
 
 class TestStrategyExecution:
     """Test strategy execution."""
@@ -191,6 +318,7 @@ class TestStrategyExecution:
             assert order is not None
             assert result.success is True
             assert "DRY RUN" in result.message
+            assert result.timestamp.date() == date.today()
 
     def test_run_with_mock_client(self):
         """Test running strategy with mock client (simulated order)."""